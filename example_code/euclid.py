@@ -1,7 +1,231 @@
-def gcd(a, b):
+"""Greatest common divisors computed using a choice of engines."""
+
+from functools import reduce
+import numpy as np
+
+
+def _gcd_recursive(a, b):
     """Return the greatest common divisor of a and b using a recursive
     implementation of Euclid's algorithm."""
     try:
-        return gcd(b, a % b)
+        return _gcd_recursive(b, a % b)
     except ZeroDivisionError:
         return a
+
+
+def _gcd_iterative(a, b):
+    """Return the greatest common divisor of a and b using a loop
+    implementation of Euclid's algorithm."""
+    while b:
+        a, b = b, a % b
+    return abs(a)
+
+
+def _gcd_binary(a, b):
+    """Return the greatest common divisor of a and b using Stein's binary
+    algorithm, which needs only shifts and subtractions."""
+    a, b = abs(a), abs(b)
+    if a == 0:
+        return b
+    if b == 0:
+        return a
+    # The largest power of two dividing both a and b.
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+
+_engines = {
+    "recursive": _gcd_recursive,
+    "iterative": _gcd_iterative,
+    "binary": _gcd_binary,
+}
+
+
+def _engine(method):
+    """Return the gcd engine called method."""
+    try:
+        return _engines[method]
+    except KeyError:
+        raise ValueError(
+            f"Unknown gcd method {method!r}. "
+            f"Valid methods are: {', '.join(_engines)}"
+        ) from None
+
+
+def gcd(a, b, method="iterative"):
+    """Return the greatest common divisor of a and b.
+
+    Parameters
+    ----------
+    a, b: int
+        The integers whose greatest common divisor is required.
+    method: str
+        The engine used to compute the result. One of:
+
+        "iterative"
+            Euclid's algorithm as a loop. The result is non-negative.
+        "binary"
+            Stein's binary algorithm. The result is non-negative.
+        "recursive"
+            Euclid's algorithm as a recursive function. This is limited by
+            the recursion depth, and the sign of the result follows that
+            of the inputs.
+    """
+    return _engine(method)(a, b)
+
+
+def gcd_many(iterable, method="iterative"):
+    """Return the greatest common divisor of all the integers in iterable.
+
+    The gcd of an empty iterable is 0. The reduction stops early if the
+    result reaches 1.
+    """
+    engine = _engine(method)
+    result = 0
+    for value in iterable:
+        result = engine(result, value)
+        if result == 1:
+            break
+    return abs(result)
+
+
+def lcm(a, b, method="iterative"):
+    """Return the lowest common multiple of a and b."""
+    if a == 0 or b == 0:
+        return 0
+    return abs(a // gcd(a, b, method) * b)
+
+
+def lcm_many(iterable, method="iterative"):
+    """Return the lowest common multiple of all the integers in iterable.
+
+    The lcm of an empty iterable is 1.
+    """
+    _engine(method)
+    return reduce(lambda a, b: lcm(a, b, method), iterable, 1)
+
+
+def gcd_array(a, b):
+    """Return the elementwise greatest common divisor of two arrays.
+
+    Integer arrays are processed with :data:`numpy.gcd`. Arrays of Python
+    integers (dtype object), and uint64 arrays combined with signed ones,
+    are processed elementwise with :func:`gcd`, so arbitrarily large values
+    are supported. The usual broadcasting rules apply.
+    """
+    a = np.asarray(a)
+    b = np.asarray(b)
+    if a.dtype != object and b.dtype != object:
+        if not (np.issubdtype(a.dtype, np.integer)
+                and np.issubdtype(b.dtype, np.integer)):
+            raise TypeError(
+                f"gcd_array expects integer arrays, not {a.dtype} and "
+                f"{b.dtype}"
+            )
+        if np.issubdtype(np.result_type(a, b), np.integer):
+            return np.gcd(a, b)
+        # No integer type holds both uint64 and a signed type, so use Python
+        # integers.
+        a, b = a.astype(object), b.astype(object)
+    return np.frompyfunc(_gcd_iterative, 2, 1)(a, b)
+
+
+def extended_gcd(a, b):
+    """Return (g, x, y) such that g = gcd(a, b) and a*x + b*y = g.
+
+    This uses the iterative extended Euclidean algorithm. g is always
+    non-negative.
+    """
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
+    if old_r < 0:
+        return -old_r, -old_x, -old_y
+    return old_r, old_x, old_y
+
+
+def modinv(a, m):
+    """Return the inverse of a modulo m, in the range [0, m).
+
+    A ValueError is raised if a is not invertible modulo m.
+    """
+    if m < 1:
+        raise ValueError(f"The modulus must be a positive integer, not {m}")
+    g, x, _ = extended_gcd(a % m, m)
+    if g != 1:
+        raise ValueError(f"{a} is not invertible modulo {m}")
+    return x % m
+
+
+def extended_gcd_array(a, b):
+    """Return arrays (g, x, y) such that g = gcd(a, b) and a*x + b*y = g
+    elementwise.
+
+    For integer arrays, every pair is advanced one step of the extended
+    Euclidean algorithm at a time using array operations, so the number of
+    Python-level iterations is the number of steps required by the slowest
+    pair. Arrays of Python integers (dtype object), and uint64 arrays, which
+    no signed integer type can hold, are processed pair by pair with
+    :func:`extended_gcd`.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a), np.asarray(b))
+    if a.dtype != object and b.dtype != object:
+        if not (np.issubdtype(a.dtype, np.integer)
+                and np.issubdtype(b.dtype, np.integer)):
+            raise TypeError(
+                "extended_gcd_array expects integer arrays, "
+                f"not {a.dtype} and {b.dtype}"
+            )
+        dtype = np.result_type(a, b, np.int8)
+        if not np.issubdtype(dtype, np.integer):
+            # No signed integer type holds uint64, so use Python integers.
+            a, b = a.astype(object), b.astype(object)
+    if a.dtype == object or b.dtype == object:
+        g, x, y = (np.empty(a.shape, dtype=object) for _ in range(3))
+        for i in np.ndindex(a.shape):
+            g[i], x[i], y[i] = extended_gcd(int(a[i]), int(b[i]))
+        return g, x, y
+
+    old_r, r = a.astype(dtype), b.astype(dtype)
+    old_x, x = np.ones_like(old_r), np.zeros_like(old_r)
+    old_y, y = np.zeros_like(old_r), np.ones_like(old_r)
+    active = r != 0
+    while active.any():
+        # Only advance the pairs which have not yet finished. Dividing by 1
+        # where r is zero avoids spurious division warnings.
+        q = old_r // np.where(active, r, 1)
+        old_r, r = (np.where(active, r, old_r),
+                    np.where(active, old_r - q * r, r))
+        old_x, x = (np.where(active, x, old_x),
+                    np.where(active, old_x - q * x, x))
+        old_y, y = (np.where(active, y, old_y),
+                    np.where(active, old_y - q * y, y))
+        active = r != 0
+    sign = np.where(old_r < 0, -1, 1).astype(dtype)
+    return old_r * sign, old_x * sign, old_y * sign
+
+
+def modinv_array(a, m):
+    """Return the inverses of the elements of a modulo m, elementwise.
+
+    m may be a single modulus or an array broadcastable against a. A
+    ValueError is raised if any element is not invertible.
+    """
+    a, m = np.asarray(a), np.asarray(m)
+    if (m < 1).any():
+        raise ValueError("The moduli must be positive integers")
+    g, x, _ = extended_gcd_array(a % m, m)
+    if (g != 1).any():
+        raise ValueError("Not every element is invertible")
+    return x % m
@@ -1,5 +1,7 @@
+from concurrent.futures import ProcessPoolExecutor
 from functools import singledispatch
-import expressions
+import numpy as np
+from example_code import expressions
 
 
 @singledispatch
@@ -79,3 +81,319 @@ def postvisitor(expr, fn, **kwargs):
     return fn(expr,
               *(postvisitor(c, fn, **kwargs) for c in expr.operands),
               **kwargs)
+
+
+def memoized_postvisitor(expr, fn, **kwargs):
+    '''Visit an Expression in postorder applying a function once to every
+    distinct node.
+
+    This has the same interface as :func:`postvisitor`, but the result of
+    visiting each node is cached by node identity for the duration of the
+    traversal. A subexpression shared by several operators is therefore
+    visited once, rather than once per path to it, which can be
+    exponentially faster on the DAGs produced by, for example, symbolic
+    differentiation. The traversal uses an explicit stack rather than
+    recursion, so arbitrarily deep expressions can be visited.
+
+    Parameters
+    ----------
+    expr: Expression
+        The expression to be visited.
+    fn: `function(node, *o, **kwargs)`
+        A function to be applied at each node. The function should take
+        the node to be visited as its first argument, and the results of
+        visiting its operands as any further positional arguments. Any
+        additional information that the visitor requires can be passed in
+        as keyword arguments.
+    **kwargs:
+        Any additional keyword arguments to be passed to fn.
+    '''
+    results = {}
+    for node in _distinct_postorder(expr):
+        results[id(node)] = fn(node,
+                               *(results[id(o)] for o in node.operands),
+                               **kwargs)
+    return results[id(expr)]
+
+
+# Python source templates for the operators which compile_expression can
+# inline.
+_templates = {
+    expressions.Add: "{0} + {1}",
+    expressions.Sub: "{0} - {1}",
+    expressions.Mul: "{0} * {1}",
+    expressions.Div: "{0} / {1}",
+    expressions.Pow: "{0} ** {1}",
+}
+
+
+class CompiledExpression:
+    """A Python function generated from an expression by
+    :func:`compile_expression`.
+
+    Calling the object evaluates the expression. Symbol values can be passed
+    as a symbol_map dictionary, as keyword arguments, or both. Since the
+    generated code only uses Python arithmetic operators, the symbol values
+    can be NumPy arrays, in which case the whole expression is evaluated in
+    one vectorised pass.
+
+    Attributes
+    ----------
+    symbols: tuple
+        The names of the symbols in the expression.
+    source: str
+        The source code of the generated function.
+    """
+
+    def __init__(self, expr):
+        self.expr = expr
+        lines = []
+        names = {}
+        namespace = {"evaluate": evaluate}
+        symbols = []
+
+        def name(node):
+            return names[node]
+
+        # Hash-consed expressions share repeated subexpressions, so generate
+        # one statement per distinct node, children first.
+        for node in _distinct_postorder(expr):
+            if isinstance(node, expressions.Symbol):
+                names[node] = f"s{len(symbols)}"
+                symbols.append(node.value)
+            elif isinstance(node, expressions.Number):
+                names[node] = f"c{len(names)}"
+                namespace[names[node]] = node.value
+            elif type(node) in _templates:
+                names[node] = f"t{len(names)}"
+                lines.append(f"    {names[node]} = " + _templates[
+                    type(node)].format(*map(name, node.operands)))
+            else:
+                # Fall back to the evaluate rule registered for this type.
+                index = len(names)
+                names[node] = f"t{index}"
+                namespace[f"n{index}"] = node
+                operands = "".join(f", {name(o)}" for o in node.operands)
+                lines.append(f"    t{index} = evaluate(n{index}{operands}, "
+                             "symbol_map=symbol_map)")
+
+        self.symbols = tuple(symbols)
+        arguments = ", ".join(names[expressions.Symbol(s)] for s in symbols)
+        self.source = "\n".join(
+            [f"def compiled(symbol_map, {arguments}):"]
+            + lines
+            + [f"    return {names[expr]}"]
+        )
+        exec(self.source, namespace)
+        self._function = namespace["compiled"]
+
+    def __call__(self, symbol_map=None, **kwargs):
+        symbol_map = dict(symbol_map or {}, **kwargs)
+        return self._function(symbol_map,
+                              *(symbol_map[s] for s in self.symbols))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.expr!r})"
+
+
+def _distinct_postorder(expr):
+    """Return the distinct nodes of expr in postorder, without recursion.
+
+    Nodes are distinguished by identity, so a subexpression shared by
+    several operators appears once, before all of them.
+    """
+    order = []
+    seen = {id(expr)}
+    stack = [(expr, iter(expr.operands))]
+    while stack:
+        node, operands = stack[-1]
+        for o in operands:
+            if id(o) not in seen:
+                seen.add(id(o))
+                stack.append((o, iter(o.operands)))
+                break
+        else:
+            stack.pop()
+            order.append(node)
+    return order
+
+
+def compile_expression(expr):
+    """Compile an expression into a Python function.
+
+    The expression is traversed once, and Python source is generated which
+    evaluates each distinct subexpression once. Operators are inlined as
+    Python arithmetic, and any other node types use the rule registered for
+    them with :func:`evaluate`. The resulting function accepts NumPy arrays
+    as symbol values, so evaluating an expression at a million points is a
+    single call.
+
+    Parameters
+    ----------
+    expr: Expression
+        The expression to be compiled.
+
+    Returns
+    -------
+    CompiledExpression
+        A callable taking a symbol_map and/or keyword arguments giving the
+        values of the symbols.
+    """
+    return CompiledExpression(expr)
+
+
+class IncrementalEvaluator:
+    """Evaluate an expression repeatedly as the values of symbols change.
+
+    The value of every distinct subexpression is cached, along with the set
+    of symbols on which it depends. When some symbol values are updated,
+    only the subexpressions depending on those symbols are re-evaluated,
+    using :func:`evaluate`. Any node types with evaluate rules registered
+    are therefore supported.
+
+    Parameters
+    ----------
+    expr: Expression
+        The expression to be evaluated.
+    symbol_map: dict
+        The initial values of all of the symbols in expr.
+    **kwargs:
+        Any additional keyword arguments to be passed to evaluate.
+
+    Attributes
+    ----------
+    value:
+        The value of the expression for the current symbol values.
+    """
+
+    def __init__(self, expr, symbol_map, **kwargs):
+        self.expr = expr
+        self.symbol_map = dict(symbol_map)
+        self.kwargs = kwargs
+        self._order = _distinct_postorder(expr)
+        position = {id(node): i for i, node in enumerate(self._order)}
+        self._operands = [tuple(position[id(o)] for o in node.operands)
+                          for node in self._order]
+
+        # For each symbol, the positions of the nodes depending on it. These
+        # are in postorder, so operands come before their operators.
+        dependencies = []
+        self._dependents = {}
+        for i, node in enumerate(self._order):
+            if isinstance(node, expressions.Symbol):
+                depends = frozenset((node.value,))
+            else:
+                depends = frozenset().union(
+                    *(dependencies[j] for j in self._operands[i])
+                )
+            dependencies.append(depends)
+            for name in depends:
+                self._dependents.setdefault(name, []).append(i)
+
+        self._values = [None] * len(self._order)
+        self._evaluate(range(len(self._order)))
+
+    def _evaluate(self, positions):
+        """Re-evaluate the nodes at positions, which must be in postorder."""
+        values = self._values
+        for i in positions:
+            values[i] = evaluate(self._order[i],
+                                 *(values[j] for j in self._operands[i]),
+                                 symbol_map=self.symbol_map, **self.kwargs)
+
+    @property
+    def value(self):
+        return self._values[-1]
+
+    def update(self, symbol_map=None, **kwargs):
+        """Change the values of some symbols and return the new value.
+
+        Parameters
+        ----------
+        symbol_map: dict
+            New values for some of the symbols.
+        **kwargs:
+            Further new symbol values, given by name.
+        """
+        changes = dict(symbol_map or {}, **kwargs)
+        self.symbol_map.update(changes)
+        dirty = set()
+        for name in changes:
+            dirty.update(self._dependents.get(name, ()))
+        self._evaluate(sorted(dirty))
+        return self.value
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.expr!r}, {self.symbol_map!r})"
+
+
+# The compiled expression in each worker process of evaluate_many.
+_worker_expression = None
+
+
+def _initialise_worker(expr):
+    """Compile expr once in a newly started worker process."""
+    global _worker_expression
+    _worker_expression = compile_expression(expr)
+
+
+def _evaluate_chunk(columns, size):
+    """Evaluate the worker's expression on one chunk of symbol columns."""
+    return np.broadcast_to(_worker_expression(columns), (size,))
+
+
+def evaluate_many(expr, symbol_table, workers=1, chunk_size=10000):
+    """Evaluate an expression for every row of a table of symbol values.
+
+    The expression is compiled with :func:`compile_expression` and
+    evaluated on whole chunks of rows at once. If workers is greater than 1
+    then the chunks are evaluated in parallel in a process pool. The
+    expression is sent to each worker once, when the worker starts, rather
+    than with every chunk.
+
+    Parameters
+    ----------
+    expr: Expression
+        The expression to be evaluated.
+    symbol_table: dict or pandas.DataFrame
+        A column of values for each symbol in expr, with one row per
+        evaluation. Columns not naming a symbol in expr are ignored.
+    workers: int
+        The number of worker processes.
+    chunk_size: int
+        The number of rows in each chunk of work.
+
+    Returns
+    -------
+    numpy.ndarray
+        The value of the expression for each row, in row order.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+    compiled = compile_expression(expr)
+    columns = {s: np.asarray(symbol_table[s]) for s in compiled.symbols}
+    # A constant expression has no symbol columns, so use all the columns.
+    lengths = {len(c) for c in columns.values()} \
+        or {len(symbol_table[name]) for name in symbol_table}
+    if not lengths:
+        raise ValueError("The number of rows cannot be inferred from an "
+                         "empty symbol_table.")
+    if len(lengths) > 1:
+        raise ValueError("All symbol columns must have the same length.")
+    rows, = lengths
+    chunks = [
+        ({s: c[start:start + chunk_size] for s, c in columns.items()},
+         min(chunk_size, rows - start))
+        for start in range(0, rows, chunk_size)
+    ]
+    if not chunks:
+        return np.empty(0)
+
+    if workers <= 1:
+        results = [np.broadcast_to(compiled(c), (size,))
+                   for c, size in chunks]
+    else:
+        with ProcessPoolExecutor(workers, initializer=_initialise_worker,
+                                 initargs=(expr,)) as pool:
+            results = list(pool.map(_evaluate_chunk, *zip(*chunks)))
+    return np.concatenate(results)
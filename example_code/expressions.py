@@ -0,0 +1,272 @@
+"""A symbolic expression language with hash-consed expression nodes.
+
+Expressions are trees (or rather DAGs) of :class:`Operator` and
+:class:`Terminal` nodes, built up using the usual arithmetic operators::
+
+    x = Symbol("x")
+    expr = 2 * x + 4 ** (5 + x)
+
+Nodes are immutable and hash-consed: creating a node identical to one which
+already exists returns the existing object. Repeated subexpressions are
+therefore stored only once, structural equality is object identity, and
+each node's hash is computed once, when it is created.
+"""
+
+import math
+from numbers import Number as _Number
+from weakref import WeakValueDictionary
+
+# Every live expression node, keyed by its structure.
+_interned = WeakValueDictionary()
+
+
+class Expression:
+    """The base class of all expression nodes.
+
+    Parameters
+    ----------
+    *operands: Expression
+        The operands of this node.
+    """
+
+    __slots__ = ("operands", "_hash", "__weakref__")
+
+    def __new__(cls, *operands):
+        return cls._intern((cls, operands), operands)
+
+    @classmethod
+    def _intern(cls, key, operands):
+        """Return the node with this key, creating it if necessary."""
+        try:
+            return _interned[key]
+        except KeyError:
+            pass
+        self = object.__new__(cls)
+        object.__setattr__(self, "operands", operands)
+        object.__setattr__(self, "_hash", hash(key))
+        self._init_extra(key)
+        # Another thread may have created the same node in the meantime.
+        return _interned.setdefault(key, self)
+
+    def _init_extra(self, key):
+        """Set any further attributes of a new node."""
+        pass
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        # Hash-consing guarantees that structurally equal nodes are the same
+        # object.
+        return self is other
+
+    def __reduce__(self):
+        return (type(self), self.operands)
+
+    def __add__(self, other):
+        other = _as_expression(other)
+        return NotImplemented if other is None else Add(self, other)
+
+    def __radd__(self, other):
+        other = _as_expression(other)
+        return NotImplemented if other is None else Add(other, self)
+
+    def __sub__(self, other):
+        other = _as_expression(other)
+        return NotImplemented if other is None else Sub(self, other)
+
+    def __rsub__(self, other):
+        other = _as_expression(other)
+        return NotImplemented if other is None else Sub(other, self)
+
+    def __mul__(self, other):
+        other = _as_expression(other)
+        return NotImplemented if other is None else Mul(self, other)
+
+    def __rmul__(self, other):
+        other = _as_expression(other)
+        return NotImplemented if other is None else Mul(other, self)
+
+    def __truediv__(self, other):
+        other = _as_expression(other)
+        return NotImplemented if other is None else Div(self, other)
+
+    def __rtruediv__(self, other):
+        other = _as_expression(other)
+        return NotImplemented if other is None else Div(other, self)
+
+    def __pow__(self, other):
+        other = _as_expression(other)
+        return NotImplemented if other is None else Pow(self, other)
+
+    def __rpow__(self, other):
+        other = _as_expression(other)
+        return NotImplemented if other is None else Pow(other, self)
+
+
+def _as_expression(value):
+    """Return value as an Expression, or None if this is not possible."""
+    if isinstance(value, Expression):
+        return value
+    elif isinstance(value, _Number):
+        return Number(value)
+    else:
+        return None
+
+
+def _signs(value):
+    """Return the signs of the floating point components of value."""
+    if isinstance(value, float):
+        return (math.copysign(1, value),)
+    elif isinstance(value, complex):
+        return (math.copysign(1, value.real), math.copysign(1, value.imag))
+    return ()
+
+
+class Terminal(Expression):
+    """An expression node with no operands, only a value.
+
+    Parameters
+    ----------
+    value:
+        The value of the terminal.
+    """
+
+    __slots__ = ("value",)
+    precedence = 4
+
+    def __new__(cls, value):
+        cls._validate(value)
+        # The type is part of the key so that, for example, Number(1) and
+        # Number(1.0) remain distinct. Likewise the signs of floating point
+        # zeros, since -0.0 == 0.0.
+        return cls._intern((cls, type(value), value, _signs(value)), ())
+
+    def _init_extra(self, key):
+        object.__setattr__(self, "value", key[2])
+
+    @classmethod
+    def _validate(cls, value):
+        """Ensure that value is an allowed value for this terminal."""
+        pass
+
+    def __reduce__(self):
+        return (type(self), (self.value,))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.value!r})"
+
+    def __str__(self):
+        return str(self.value)
+
+
+class Number(Terminal):
+    """A numerical constant."""
+
+    __slots__ = ()
+
+    @classmethod
+    def _validate(cls, value):
+        if not isinstance(value, _Number):
+            raise TypeError(
+                f"Number value must be a number, not a {type(value).__name__}"
+            )
+
+
+class Symbol(Terminal):
+    """A named symbol."""
+
+    __slots__ = ()
+
+    @classmethod
+    def _validate(cls, value):
+        if not isinstance(value, str):
+            raise TypeError(
+                f"Symbol value must be a str, not a {type(value).__name__}"
+            )
+
+
+class Operator(Expression):
+    """An expression node applying an operation to its operands."""
+
+    __slots__ = ()
+
+    def __new__(cls, *operands):
+        for o in operands:
+            if not isinstance(o, Expression):
+                raise TypeError(f"{cls.__name__} operands must be "
+                                f"Expressions, not {type(o).__name__}")
+        return cls._intern((cls, operands), operands)
+
+    def __repr__(self):
+        return type(self).__name__ + repr(self.operands)
+
+    def __str__(self):
+        left, right = self.operands
+        left_string = str(left)
+        right_string = str(right)
+        if left.precedence < self.precedence or \
+                (left.precedence == self.precedence
+                 and not self.left_associative):
+            left_string = f"({left_string})"
+        if right.precedence < self.precedence or \
+                (right.precedence == self.precedence
+                 and not self.right_associative):
+            right_string = f"({right_string})"
+        return f"{left_string} {self.symbol} {right_string}"
+
+
+class Add(Operator):
+    """The sum of two expressions."""
+
+    __slots__ = ()
+    symbol = "+"
+    precedence = 1
+    left_associative = True
+    right_associative = True
+
+
+class Sub(Operator):
+    """The difference of two expressions."""
+
+    __slots__ = ()
+    symbol = "-"
+    precedence = 1
+    left_associative = True
+    right_associative = False
+
+
+class Mul(Operator):
+    """The product of two expressions."""
+
+    __slots__ = ()
+    symbol = "*"
+    precedence = 2
+    left_associative = True
+    right_associative = True
+
+
+class Div(Operator):
+    """The quotient of two expressions."""
+
+    __slots__ = ()
+    symbol = "/"
+    precedence = 2
+    left_associative = True
+    right_associative = False
+
+
+class Pow(Operator):
+    """One expression raised to the power of another."""
+
+    __slots__ = ()
+    symbol = "^"
+    precedence = 3
+    left_associative = False
+    right_associative = True
@@ -0,0 +1,228 @@
+"""A compact, array-based tree representation with vectorised traversals.
+
+A :class:`FlatTree` stores a tree as a handful of NumPy arrays rather than
+one :class:`~example_code.graphs.TreeNode` object per node. Nodes are
+numbered in level order (breadth first), so the nodes at each depth form a
+contiguous range and every traversal can process a whole level, or
+frontier, with a few array operations.
+"""
+
+import numpy as np
+from example_code.graphs import TreeNode
+
+
+def _assign(array, index, values):
+    """Set array[index] = values and return array.
+
+    If values cannot be stored in array without loss, a promoted copy of
+    array is used instead.
+    """
+    try:
+        dtype = np.result_type(array, values)
+    except TypeError:
+        dtype = np.dtype(object)
+    if dtype != array.dtype:
+        array = array.astype(dtype)
+    array[index] = values
+    return array
+
+
+class FlatTree:
+    """A tree stored in compressed sparse row (CSR) form.
+
+    Nodes are numbered in level order, with the root as node 0.
+
+    Parameters
+    ----------
+    values: numpy.ndarray
+        The value of each node.
+    parent: numpy.ndarray
+        The parent of each node, or -1 for the root.
+    child_offsets: numpy.ndarray
+        The children of node i are
+        `child_indices[child_offsets[i]:child_offsets[i+1]]`.
+    child_indices: numpy.ndarray
+        The children of all the nodes, concatenated.
+    level_offsets: numpy.ndarray
+        The nodes at depth d are those numbered from `level_offsets[d]` up
+        to, but not including, `level_offsets[d+1]`.
+    """
+
+    def __init__(self, values, parent, child_offsets, child_indices,
+                 level_offsets):
+        self.values = values
+        self.parent = parent
+        self.child_offsets = child_offsets
+        self.child_indices = child_indices
+        self.level_offsets = level_offsets
+
+    @classmethod
+    def from_treenode(cls, tree, dtype=None):
+        """Create a FlatTree from a tree of :class:`TreeNode` objects.
+
+        Parameters
+        ----------
+        tree: TreeNode
+            The root of the tree.
+        dtype: numpy.dtype
+            The dtype of the values array. If not given, NumPy infers it
+            from the node values.
+        """
+        nodes = [tree]
+        parent = [-1]
+        child_counts = []
+        level_offsets = [0]
+        start = 0
+        # Breadth first traversal. nodes grows as children are found.
+        while start < len(nodes):
+            stop = len(nodes)
+            for i in range(start, stop):
+                children = nodes[i].children
+                child_counts.append(len(children))
+                nodes.extend(children)
+                parent.extend([i] * len(children))
+            level_offsets.append(stop)
+            start = stop
+
+        values = [n.value for n in nodes]
+        try:
+            array = np.array(values, dtype=dtype)
+        except ValueError:
+            array = None
+        if array is None or array.ndim != 1:
+            # Values, such as tuples, which NumPy would otherwise interpret
+            # as extra array dimensions.
+            array = np.empty(len(values), dtype=object)
+            for i, v in enumerate(values):
+                array[i] = v
+
+        child_offsets = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(child_counts, out=child_offsets[1:])
+        return cls(array,
+                   np.array(parent, dtype=np.int64),
+                   child_offsets,
+                   np.arange(1, len(nodes), dtype=np.int64),
+                   np.array(level_offsets, dtype=np.int64))
+
+    def to_treenode(self):
+        """Return the equivalent tree of :class:`TreeNode` objects."""
+        values = self.values.tolist()
+        offsets = self.child_offsets.tolist()
+        indices = self.child_indices.tolist()
+        nodes = [None] * len(values)
+        # Children are numbered after their parents, so build in reverse.
+        for i in range(len(values) - 1, -1, -1):
+            nodes[i] = TreeNode(
+                values[i],
+                *map(nodes.__getitem__, indices[offsets[i]:offsets[i + 1]])
+            )
+        return nodes[0]
+
+    def __len__(self):
+        return len(self.parent)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self)} nodes, " \
+            f"depth {len(self.level_offsets) - 2})"
+
+    def levels(self):
+        """Generate a slice selecting the nodes at each depth, root first."""
+        offsets = self.level_offsets.tolist()
+        for start, stop in zip(offsets[:-1], offsets[1:]):
+            yield slice(start, stop)
+
+    def children(self, i):
+        """Return the indices of the children of node i."""
+        return self.child_indices[self.child_offsets[i]:
+                                  self.child_offsets[i + 1]]
+
+    def previsitor(self, fn, root_input=None):
+        """Visit the tree one level at a time from the root, passing the
+        results of visiting the parents of each level to the next.
+
+        Parameters
+        ----------
+        fn: function(nodes, parent_results)
+            A function applied to each level. nodes is an array of the
+            indices of the nodes at this level, and parent_results is an
+            array of the results of visiting their parents. The function
+            must return an array of results, one per node.
+        root_input:
+            The value passed as the parent result of the root.
+
+        Returns
+        -------
+        numpy.ndarray
+            The result of visiting each node.
+        """
+        results = None
+        for level in self.levels():
+            nodes = np.arange(level.start, level.stop)
+            if results is None:
+                parent_results = np.array([root_input])
+            else:
+                parent_results = results[self.parent[level]]
+            out = np.asarray(fn(nodes, parent_results))
+            if results is None:
+                results = np.empty(len(self), dtype=out.dtype)
+            results = _assign(results, level, out)
+        return results
+
+    def postvisitor(self, fn, reduce=np.add, identity=0):
+        """Visit the tree one level at a time from the leaves, passing the
+        combined results of visiting the children of each node to it.
+
+        Parameters
+        ----------
+        fn: function(nodes, child_results)
+            A function applied to each level. nodes is an array of the
+            indices of the nodes at this level, and child_results is an
+            array of the children's results reduced using reduce. The
+            function must return an array of results, one per node.
+        reduce: numpy.ufunc
+            The binary ufunc used to combine the results of the children
+            of a node.
+        identity:
+            The reduced child result of a leaf.
+
+        Returns
+        -------
+        numpy.ndarray
+            The result of visiting each node.
+        """
+        results = None
+        combined = None
+        for level in reversed(list(self.levels())):
+            nodes = np.arange(level.start, level.stop)
+            if combined is None:
+                child_results = np.full(len(nodes), identity)
+            else:
+                child_results = combined[level]
+            out = np.asarray(fn(nodes, child_results))
+            if results is None:
+                results = np.empty(len(self), dtype=out.dtype)
+                combined = np.full(len(self), identity,
+                                   dtype=np.result_type(out, identity))
+            results = _assign(results, level, out)
+            if level.start == 0:
+                break
+            # Parents are in increasing order, so siblings are adjacent and
+            # can be combined with a single reduceat.
+            parents = self.parent[level]
+            starts = np.flatnonzero(np.diff(parents, prepend=-1))
+            combined = _assign(combined, parents[starts],
+                               reduce.reduceat(out, starts))
+        return results
+
+    def depths(self):
+        """Return the depth of every node, with the root at depth 0."""
+        return np.repeat(np.arange(len(self.level_offsets) - 1),
+                         np.diff(self.level_offsets))
+
+    def subtree_sizes(self):
+        """Return the number of nodes in the subtree rooted at each node."""
+        return self.postvisitor(lambda nodes, c: c + 1)
+
+    def subtree_sums(self):
+        """Return the sum of the values in the subtree rooted at each node."""
+        return self.postvisitor(lambda nodes, c: c + self.values[nodes])
@@ -1,5 +1,7 @@
 """A simple tree implementation with basic pre- and post-visitors."""
 
+from collections import deque
+
 
 class TreeNode:
     """A basic tree implementation.
@@ -59,3 +61,198 @@ def postvisitor(tree, fn):
         visiting its children as any further arguments.
     """
     return fn(tree, *(postvisitor(c, fn) for c in tree.children))
+
+
+def previsitor_iterative(tree, fn, fn_parent=None):
+    """Traverse tree in preorder applying a function to every node.
+
+    This has the same behaviour as :func:`previsitor`, but uses an explicit
+    stack instead of recursion, so it is not limited by the depth of the
+    tree.
+
+    Parameters
+    ----------
+    tree: TreeNode
+        The tree to be visited.
+    fn: function(node, fn_parent)
+        A function to be applied at each node. The function should take
+        the node to be visited as its first argument, and the result of
+        visiting its parent as the second.
+    """
+    # The stack holds nodes interleaved with the results of visiting their
+    # parents.
+    stack = [fn_parent, tree]
+    pop = stack.pop
+    push = stack.extend
+    while stack:
+        node = pop()
+        fn_out = fn(node, pop())
+        # Push the children in reverse so that the first child is visited
+        # first.
+        for child in reversed(node.children):
+            push((fn_out, child))
+
+
+def postvisitor_iterative(tree, fn):
+    r"""Traverse tree in postorder applying a function to every node.
+
+    This has the same behaviour as :func:`postvisitor`, but uses an explicit
+    stack instead of recursion, so it is not limited by the depth of the
+    tree.
+
+    Parameters
+    ----------
+    tree: TreeNode
+        The tree to be visited.
+    fn: function(node, \*fn_children)
+        A function to be applied at each node. The function should take the
+        node to be visited as its first argument, and the results of
+        visiting its children as any further arguments.
+    """
+    done = object()
+    # Each stack entry holds a node, an iterator over its unvisited
+    # children, and the results of visiting its visited children.
+    stack = [(tree, iter(tree.children), [])]
+    while True:
+        node, children, results = stack[-1]
+        child = next(children, done)
+        if child is done:
+            stack.pop()
+            fn_out = fn(node, *results)
+            if not stack:
+                return fn_out
+            stack[-1][2].append(fn_out)
+        else:
+            stack.append((child, iter(child.children), []))
+
+
+def topological_order(tree):
+    """Return the distinct nodes of a DAG, each preceded by its children.
+
+    Nodes are identified by object identity, so a subtree shared by several
+    parents appears only once. The order is the postorder of first visits,
+    computed without recursion. It can be computed once and passed to
+    :func:`dag_postvisitor` for repeated traversals of the same DAG.
+
+    Parameters
+    ----------
+    tree: TreeNode
+        The root of the DAG.
+
+    Returns
+    -------
+    list
+        The nodes in topological order, ending with tree.
+    """
+    order = []
+    seen = {id(tree)}
+    stack = [(tree, iter(tree.children))]
+    while stack:
+        node, children = stack[-1]
+        for child in children:
+            if id(child) not in seen:
+                seen.add(id(child))
+                stack.append((child, iter(child.children)))
+                break
+        else:
+            stack.pop()
+            order.append(node)
+    return order
+
+
+def dag_postvisitor(tree, fn, order=None):
+    r"""Traverse a DAG in postorder, applying a function once to every
+    distinct node.
+
+    The result of visiting each node is cached by node identity, so a
+    subtree shared by several parents is visited once and its result reused.
+    On DAGs with many shared subtrees this is exponentially faster than
+    :func:`postvisitor`, which visits a shared subtree once per path to it.
+
+    Parameters
+    ----------
+    tree: TreeNode
+        The root of the DAG to be visited.
+    fn: function(node, \*fn_children)
+        A function to be applied at each node. The function should take the
+        node to be visited as its first argument, and the results of
+        visiting its children as any further arguments.
+    order: list
+        The result of :func:`topological_order` for tree. If this is not
+        provided then it is computed.
+    """
+    if order is None:
+        order = topological_order(tree)
+    results = {}
+    for node in order:
+        results[id(node)] = fn(node,
+                               *(results[id(c)] for c in node.children))
+    return results[id(tree)]
+
+
+def iter_preorder(tree):
+    """Generate the nodes of tree in preorder.
+
+    Nodes are produced lazily, so a search can stop as soon as it finds the
+    node it is looking for.
+    """
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(node.children))
+
+
+def iter_postorder(tree):
+    """Generate the nodes of tree in postorder."""
+    done = object()
+    stack = [(tree, iter(tree.children))]
+    while stack:
+        node, children = stack[-1]
+        child = next(children, done)
+        if child is done:
+            stack.pop()
+            yield node
+        else:
+            stack.append((child, iter(child.children)))
+
+
+def iter_bfs(tree):
+    """Generate the nodes of tree in breadth first (level) order."""
+    queue = deque([tree])
+    while queue:
+        node = queue.popleft()
+        yield node
+        queue.extend(node.children)
+
+
+def write_tree(tree, file, chunk_size=1 << 16):
+    """Write the tree to a text file object in the format of
+    :meth:`TreeNode.__str__`.
+
+    The output is produced without recursion and written in chunks of
+    roughly chunk_size characters, so trees of any depth and size can be
+    written without building the whole string in memory.
+    """
+    buffer = []
+    size = 0
+    # Stack entries are either nodes still to be written, or strings.
+    stack = [tree]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, TreeNode):
+            text = f"{item.value!s} -> ("
+            stack.append(")")
+            for i, child in enumerate(reversed(item.children)):
+                if i:
+                    stack.append(", ")
+                stack.append(child)
+        else:
+            text = str(item)
+        buffer.append(text)
+        size += len(text)
+        if size >= chunk_size:
+            file.write("".join(buffer))
+            buffer.clear()
+            size = 0
+    file.write("".join(buffer))
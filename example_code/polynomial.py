@@ -1,8 +1,319 @@
-from numbers import Number
+from fractions import Fraction
+from numbers import Number, Integral
+import re
+import numpy as np
+
+# Coefficient counts at which multiplication switches algorithm. These can be
+# tuned using scripts/bench_polynomial.py.
+KARATSUBA_THRESHOLD = 48
+KRONECKER_THRESHOLD = 48
+FFT_THRESHOLD = 32
+
+# Division of floating point polynomials switches from long division to
+# Newton iteration when both the divisor and quotient have at least this many
+# coefficients.
+NEWTON_DIVISION_THRESHOLD = 64
+
+# Integer products whose coefficients are bounded by this are computed
+# exactly by rounding the result of a floating point FFT.
+_FFT_EXACT_BOUND = 2**40
+
+# Coefficient types which the FFT can multiply (approximately).
+_fft_types = (int, float, complex, np.number)
+
+
+def _mul_schoolbook(a, b):
+    """Multiply coefficient sequences a and b term by term."""
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return result
+
+
+def _add_into(target, source, offset):
+    """Add the coefficients in source into target, starting at offset."""
+    for i, x in enumerate(source, start=offset):
+        target[i] += x
+
+
+def _mul_karatsuba(a, b):
+    """Multiply coefficient sequences a and b using Karatsuba's algorithm.
+
+    Only addition, subtraction and multiplication of coefficients are used,
+    so the result is exact for exact coefficient types such as
+    :class:`~fractions.Fraction`.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) < KARATSUBA_THRESHOLD:
+        return _mul_schoolbook(a, b)
+
+    m = len(a) // 2
+    result = [0] * (len(a) + len(b) - 1)
+    if len(b) <= m:
+        # b is much shorter than a, so only split a.
+        _add_into(result, _mul_karatsuba(a[:m], b), 0)
+        _add_into(result, _mul_karatsuba(a[m:], b), m)
+        return result
+
+    a0, a1 = a[:m], a[m:]
+    b0, b1 = b[:m], b[m:]
+    low = _mul_karatsuba(a0, b0)
+    high = _mul_karatsuba(a1, b1)
+    # (a0 + a1)(b0 + b1) - low - high is the middle term.
+    a_sum = list(a1)
+    _add_into(a_sum, a0, 0)
+    b_sum = list(b1) + [0] * max(0, len(b0) - len(b1))
+    _add_into(b_sum, b0, 0)
+    middle = _mul_karatsuba(a_sum, b_sum)
+    _add_into(result, low, 0)
+    _add_into(result, high, 2 * m)
+    for i, x in enumerate(middle, start=m):
+        if i < len(result):
+            result[i] += x
+    _add_into(result, [-x for x in low], m)
+    _add_into(result, [-x for x in high], m)
+    return result
+
+
+def _pack(coefs, bits):
+    """Pack non-negative integer coefficients into one integer, bits apart."""
+    width = bits // 8
+    return int.from_bytes(
+        b"".join(c.to_bytes(width, "little") for c in coefs), "little"
+    )
+
+
+def _mul_kronecker(a, b):
+    """Multiply integer coefficient sequences exactly using Kronecker
+    substitution.
+
+    The polynomials are evaluated at a large power of two, the resulting
+    integers multiplied using Python's fast integer multiplication, and the
+    product coefficients read back from the bits of the result. Negative
+    coefficients are handled by splitting each polynomial into its positive
+    and negative parts.
+    """
+    a = [int(x) for x in a]
+    b = [int(x) for x in b]
+    length = len(a) + len(b) - 1
+    bound = max(map(abs, a)) * max(map(abs, b)) * min(len(a), len(b))
+    # Round the slot size up to whole bytes.
+    bits = (bound.bit_length() + 8) // 8 * 8
+    width = bits // 8
+
+    def parts(coefs):
+        return ([max(c, 0) for c in coefs], [max(-c, 0) for c in coefs])
+
+    def product(x, y):
+        if not any(x) or not any(y):
+            return 0
+        return _pack(x, bits) * _pack(y, bits)
+
+    a_pos, a_neg = parts(a)
+    b_pos, b_neg = parts(b)
+    positive = product(a_pos, b_pos) + product(a_neg, b_neg)
+    negative = product(a_pos, b_neg) + product(a_neg, b_pos)
+
+    def unpack(n):
+        data = n.to_bytes(length * width, "little")
+        return [int.from_bytes(data[i:i + width], "little")
+                for i in range(0, len(data), width)]
+
+    return [p - n for p, n in zip(unpack(positive), unpack(negative))]
+
+
+def _mul_fft(a, b):
+    """Multiply floating point coefficient sequences using the FFT.
+
+    The result is subject to rounding error of the order of machine
+    precision times the size of the largest product term.
+    """
+    a = np.asarray(a)
+    b = np.asarray(b)
+    length = len(a) + len(b) - 1
+    # Pad to a power of two for the fastest transform.
+    n = 1 << (length - 1).bit_length()
+    if np.iscomplexobj(a) or np.iscomplexobj(b):
+        result = np.fft.ifft(np.fft.fft(a, n) * np.fft.fft(b, n), n)
+    else:
+        result = np.fft.irfft(np.fft.rfft(a, n) * np.fft.rfft(b, n), n)
+    return result[:length].tolist()
+
+
+def _multiply(a, b):
+    """Multiply coefficient sequences a and b using the best algorithm for
+    their length and coefficient type."""
+    shortest = min(len(a), len(b))
+    if all(isinstance(x, Integral) for x in a) and \
+            all(isinstance(x, Integral) for x in b):
+        if shortest < KRONECKER_THRESHOLD:
+            return _mul_schoolbook(a, b)
+        if shortest >= FFT_THRESHOLD and \
+                max(map(abs, a)) * max(map(abs, b)) * shortest \
+                < _FFT_EXACT_BOUND:
+            return [int(x) for x in np.rint(_mul_fft(a, b))]
+        return _mul_kronecker(a, b)
+
+    if shortest >= FFT_THRESHOLD and \
+            all(isinstance(x, _fft_types) for x in a) and \
+            all(isinstance(x, _fft_types) for x in b):
+        return _mul_fft(a, b)
+
+    return _mul_karatsuba(a, b)
+
+
+def _trim(coefs, tol=0):
+    """Return coefs as a list with the trailing (near) zeros removed.
+
+    The zero polynomial is represented by an empty list.
+    """
+    coefs = list(coefs)
+    if tol and coefs:
+        tol *= max(abs(c) for c in coefs)
+    while coefs and abs(coefs[-1]) <= tol:
+        coefs.pop()
+    return coefs
+
+
+def _subtract(a, b):
+    """Return the coefficients of a - b."""
+    result = list(a) + [0] * max(0, len(b) - len(a))
+    for i, x in enumerate(b):
+        result[i] -= x
+    return result
+
+
+def _divide(a, b):
+    """Divide coefficient a by b, exactly if both are integers."""
+    if isinstance(a, Integral) and isinstance(b, Integral):
+        q = Fraction(int(a), int(b))
+        return q.numerator if q.denominator == 1 else q
+    return a / b
+
+
+def _divmod_long(a, b):
+    """Divide coefficient list a by the trimmed coefficient list b using
+    long division. Return the quotient and remainder."""
+    a = list(a)
+    lead = b[-1]
+    quotient = [0] * max(0, len(a) - len(b) + 1)
+    for i in range(len(quotient) - 1, -1, -1):
+        q = _divide(a[i + len(b) - 1], lead)
+        quotient[i] = q
+        if q:
+            for j, c in enumerate(b):
+                a[i + j] -= q * c
+    return quotient, a[:len(b) - 1]
+
+
+def _inverse_series(f, n):
+    """Return the first n coefficients of the power series 1/f using Newton
+    iteration, which doubles the number of correct terms each step."""
+    g = [_divide(1, f[0])]
+    while len(g) < n:
+        m = min(2 * len(g), n)
+        # g <- g(2 - fg) mod x^m
+        fg = _multiply(f[:m], g)[:m]
+        correction = _multiply(g, _subtract([2], fg))[:m]
+        g = correction + [0] * (m - len(correction))
+    return g
+
+
+def _divmod_newton(a, b):
+    """Divide coefficient list a by the trimmed coefficient list b using
+    Newton iteration on the reversed polynomials. Return the quotient and
+    remainder."""
+    k = len(a) - len(b) + 1
+    if k <= 0:
+        return [], list(a)
+    inverse = _inverse_series(b[::-1], k)
+    reversed_quotient = _multiply(a[::-1][:k], inverse)[:k]
+    quotient = reversed_quotient[::-1]
+    product = _multiply(b, quotient)
+    remainder = _subtract(a[:len(b) - 1], product[:len(b) - 1])
+    return quotient, remainder
+
+
+def _divmod(a, b):
+    """Return the quotient and remainder of coefficient lists a and b."""
+    b = _trim(b)
+    if not b:
+        raise ZeroDivisionError("polynomial division by zero")
+    a = _trim(a)
+    # Newton iteration relies on fast multiplication, so only pays off for
+    # floating point coefficients. With exact coefficients the intermediate
+    # power series has rapidly growing coefficients, and long division is
+    # faster.
+    if min(len(b), len(a) - len(b) + 1) >= NEWTON_DIVISION_THRESHOLD and \
+            not all(isinstance(x, (Integral, Fraction)) for x in a + b) and \
+            all(isinstance(x, _fft_types) for x in a + b):
+        return _divmod_newton(a, b)
+    return _divmod_long(a, b)
+
+
+# A term as written by Polynomial.__str__: a coefficient, optionally followed
+# by x or x^d.
+_term = re.compile(r"(?P<coef>.*?)(?P<x>x(\^(?P<exp>\d+))?)?")
+
+
+def _parse_coefficient(text):
+    """Convert the string representation of a coefficient to a number."""
+    for convert in (int, float, Fraction, complex):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid polynomial coefficient: {text!r}")
+
+
+def polyval(coefficients, x):
+    """Evaluate one or more polynomials using Horner's scheme.
+
+    Parameters
+    ----------
+    coefficients: sequence or numpy.ndarray
+        The coefficients of a polynomial, lowest degree first. A 2-D array
+        is interpreted as a batch of polynomials, one per row.
+    x: number or array_like
+        The point or points at which to evaluate.
+
+    Returns
+    -------
+    The value at x. If x is an array, the result is an array of the same
+    shape, computed with one vectorised operation per coefficient. For a
+    batch of polynomials, the result has shape
+    `(len(coefficients),) + numpy.shape(x)`.
+    """
+    if np.ndim(coefficients) == 2:
+        coefficients = np.asarray(coefficients)
+        x = np.asarray(x)
+        # Broadcast each coefficient column against the points.
+        columns = coefficients.T.reshape(
+            coefficients.shape[1:] + coefficients.shape[:1] + (1,) * x.ndim
+        )
+        result = np.zeros(columns.shape[1:], np.result_type(columns, x))
+        for c in columns[::-1]:
+            result = result * x + c
+        return result
+
+    if np.ndim(x) > 0:
+        x = np.asarray(x)
+        result = np.zeros(x.shape,
+                          np.result_type(np.asarray(coefficients), x))
+    else:
+        result = 0
+    for c in reversed(coefficients):
+        result = result * x + c
+    return result
 
 
 class Polynomial:
 
+    __slots__ = ("coefficients",)
+
     def __init__(self, coefs):
         self.coefficients = coefs
 
@@ -29,13 +340,38 @@ class Polynomial:
     def __repr__(self):
         return type(self).__name__ + "(" + repr(self.coefficients) + ")"
 
+    @classmethod
+    def from_string(cls, text):
+        """Create a polynomial from a string in the format produced by
+        :meth:`__str__`, such as "x^2 + 3x + 1".
+
+        Coefficients are parsed as :class:`int`, :class:`float`,
+        :class:`~fractions.Fraction` or :class:`complex`, whichever is the
+        first to succeed.
+        """
+        coefs = {}
+        for term in text.strip().split(" + "):
+            match = _term.fullmatch(term)
+            if not match or not (match["coef"] or match["x"]):
+                raise ValueError(f"Invalid polynomial term: {term!r}")
+            if match["x"]:
+                degree = int(match["exp"] or 1)
+                coef = _parse_coefficient(match["coef"]) \
+                    if match["coef"] else 1
+            else:
+                degree = 0
+                coef = _parse_coefficient(match["coef"])
+            coefs[degree] = coefs.get(degree, 0) + coef
+        return cls(tuple(coefs.get(d, 0) for d in range(max(coefs) + 1)))
+
     def __eq__(self, other):
-        return isinstance(other, Polynomial) and \
-            self.coefficients == other.coefficients
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        return self.coefficients == other.coefficients
 
     def __add__(self, other):
         if isinstance(other, Number):
-            return Polynomial((self.coefficients[0] + other,)
+            return type(self)((self.coefficients[0] + other,)
                               + self.coefficients[1:])
 
         elif isinstance(other, Polynomial):
@@ -50,10 +386,319 @@ class Polynomial:
             # summand.
             coefs += self.coefficients[common:] + other.coefficients[common:]
 
-            return Polynomial(coefs)
+            return type(self)(coefs)
 
         else:
             return NotImplemented
 
     def __radd__(self, other):
         return self + other
+
+    def __mul__(self, other):
+        if isinstance(other, Number):
+            return type(self)(tuple(c * other for c in self.coefficients))
+
+        elif isinstance(other, Polynomial):
+            return type(self)(tuple(_multiply(self.coefficients,
+                                              other.coefficients)))
+
+        else:
+            return NotImplemented
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __call__(self, x):
+        return polyval(self.coefficients, x)
+
+    def __divmod__(self, other):
+        if isinstance(other, Number):
+            other = Polynomial((other,))
+        elif not isinstance(other, Polynomial):
+            return NotImplemented
+        quotient, remainder = _divmod(self.coefficients, other.coefficients)
+        return (type(self)(tuple(quotient) or (0,)),
+                type(self)(tuple(_trim(remainder)) or (0,)))
+
+    def __floordiv__(self, other):
+        if not isinstance(other, (Number, Polynomial)):
+            return NotImplemented
+        return divmod(self, other)[0]
+
+    def __mod__(self, other):
+        if not isinstance(other, (Number, Polynomial)):
+            return NotImplemented
+        return divmod(self, other)[1]
+
+    def derivative(self):
+        """Return the derivative of this polynomial."""
+        return type(self)(tuple(d * c for d, c in
+                                enumerate(self.coefficients))[1:] or (0,))
+
+    def gcd(self, other, tol=0):
+        """Return the monic greatest common divisor of self and other.
+
+        The result is exact for exact coefficient types. For floating point
+        coefficients, remainder coefficients smaller than tol relative to
+        the largest coefficient are treated as zero.
+        """
+        a = _trim(self.coefficients)
+        b = _trim(other.coefficients)
+        while b:
+            a, b = b, _trim(_divmod(a, b)[1], tol)
+        if not a:
+            return type(self)((0,))
+        lead = a[-1]
+        return type(self)(tuple(_divide(c, lead) for c in a))
+
+    def multipoint_evaluate(self, points):
+        """Evaluate the polynomial at each of a sequence of points.
+
+        This uses Horner's scheme, which takes O(n^2) operations for n
+        points and degree n. Floating point data is vectorised over the
+        points using NumPy. Other coefficient types are evaluated one point
+        at a time, so that integers cannot overflow.
+
+        Parameters
+        ----------
+        points: sequence
+            The points at which to evaluate.
+
+        Returns
+        -------
+        list
+            The values at each point.
+        """
+        points = list(points)
+        if not points:
+            return []
+        x = np.asarray(points)
+        coefs = np.asarray(self.coefficients)
+        if np.issubdtype(np.result_type(x, coefs), np.inexact):
+            return polyval(coefs, x).tolist()
+        return [self(p) for p in points]
+
+    @classmethod
+    def interpolate(cls, points, values):
+        """Return the polynomial of lowest degree through the given points.
+
+        This computes the Newton form of the interpolating polynomial by
+        divided differences, and expands it, in O(n^2) coefficient
+        operations for n points. The points must be distinct. Integer data
+        produces exact, possibly :class:`~fractions.Fraction`, coefficients.
+        The monomial basis is badly conditioned, so floating point results
+        are only accurate for a few dozen points.
+        """
+        points = list(points)
+        differences = list(values)
+        n = len(points)
+        if len(differences) != n:
+            raise ValueError("There must be as many values as points.")
+        if not points:
+            return cls((0,))
+        for j in range(1, n):
+            for i in range(n - 1, j - 1, -1):
+                step = points[i] - points[i - j]
+                if step == 0:
+                    raise ValueError(f"The point {points[i]!r} is repeated.")
+                differences[i] = _divide(differences[i] - differences[i - 1],
+                                         step)
+        # Expand the nested Newton form from the innermost term outwards.
+        coefs = [differences[-1]]
+        for k in range(n - 2, -1, -1):
+            coefs = [differences[k] - points[k] * coefs[0]] + [
+                a - points[k] * b for a, b in zip(coefs, coefs[1:] + [0])
+            ]
+        return cls(tuple(_trim(coefs)) or (0,))
+
+
+class FrozenPolynomial(Polynomial):
+    """An immutable, hashable polynomial.
+
+    The coefficients are stored as a tuple and the hash is computed once, on
+    construction. FrozenPolynomials can therefore be used as dictionary keys
+    and set members, and comparing two FrozenPolynomials with different
+    hashes costs a single integer comparison.
+
+    Parameters
+    ----------
+    coefs: sequence
+        The coefficients, lowest degree first. A tuple is used without
+        copying.
+    """
+
+    __slots__ = ("_hash",)
+
+    def __init__(self, coefs):
+        coefs = tuple(coefs)
+        object.__setattr__(self, "coefficients", coefs)
+        object.__setattr__(self, "_hash", hash((Polynomial, coefs)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenPolynomial):
+            return self is other or (
+                self._hash == other._hash
+                and self.coefficients == other.coefficients
+            )
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        return self.coefficients == tuple(other.coefficients)
+
+    def __reduce__(self):
+        return (type(self), (self.coefficients,))
+
+
+def _convolve(a, b):
+    """Multiply coefficient arrays a and b, returning an array."""
+    if a.dtype == object or b.dtype == object:
+        return np.array(_multiply(a.tolist(), b.tolist()), dtype=object)
+    if min(len(a), len(b)) >= FFT_THRESHOLD and \
+            np.issubdtype(np.result_type(a, b), np.inexact):
+        return np.array(_mul_fft(a, b))
+    return np.convolve(a, b)
+
+
+def _scalar_result_type(array, scalar):
+    """Return the dtype of an operation between array and a Python scalar.
+
+    NumPy keeps the array's integer dtype for a Python integer, and raises
+    OverflowError if the integer does not fit. In that case, promote to a
+    dtype which can hold the scalar.
+    """
+    dtype = np.result_type(array, scalar)
+    if np.issubdtype(dtype, np.integer) and isinstance(scalar, Integral):
+        info = np.iinfo(dtype)
+        if not info.min <= scalar <= info.max:
+            return np.result_type(array, np.min_scalar_type(scalar))
+    return dtype
+
+
+class ArrayPolynomial(Polynomial):
+    """A polynomial whose coefficients are stored in a 1-D NumPy array.
+
+    Neither this class nor :class:`Polynomial` has an instance
+    :attr:`~object.__dict__`, so each polynomial costs one small object
+    plus one contiguous buffer of coefficients. Slicing returns a new
+    polynomial viewing the same buffer, and `+=` and `*=` update the
+    coefficients in place where the result fits.
+
+    Parameters
+    ----------
+    coefs: array_like
+        The coefficients, lowest degree first. An existing array of the
+        right dtype is used without copying.
+    dtype: numpy.dtype
+        The coefficient dtype. If not given, this is inferred from coefs.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, coefs, dtype=None):
+        coefs = np.asarray(coefs, dtype=dtype)
+        if coefs.ndim != 1:
+            raise ValueError("ArrayPolynomial coefficients must be a 1-D "
+                             f"array, not {coefs.ndim}-D")
+        self.coefficients = coefs
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return type(self)(self.coefficients[index])
+        return self.coefficients[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        return np.array_equal(self.coefficients,
+                              np.asarray(other.coefficients))
+
+    def __add__(self, other):
+        if isinstance(other, Number):
+            coefs = self.coefficients.astype(
+                _scalar_result_type(self.coefficients, other)
+            )
+            coefs[0] += other
+            return type(self)(coefs)
+
+        elif isinstance(other, Polynomial):
+            other = np.asarray(other.coefficients)
+            mine = self.coefficients
+            if len(mine) < len(other):
+                mine, other = other, mine
+            coefs = mine.astype(np.result_type(mine, other))
+            coefs[:len(other)] += other
+            return type(self)(coefs)
+
+        else:
+            return NotImplemented
+
+    def __radd__(self, other):
+        return self + other
+
+    def __iadd__(self, other):
+        # Read only buffers, such as memory mapped archives, are never
+        # updated in place.
+        writeable = self.coefficients.flags.writeable
+        if isinstance(other, Number):
+            if writeable and np.can_cast(
+                _scalar_result_type(self.coefficients, other),
+                self.coefficients.dtype
+            ):
+                self.coefficients[0] += other
+                return self
+
+        elif isinstance(other, Polynomial):
+            other = np.asarray(other.coefficients)
+            if writeable and len(other) <= len(self.coefficients) and \
+                    np.can_cast(other.dtype, self.coefficients.dtype):
+                self.coefficients[:len(other)] += other
+                return self
+
+        else:
+            return NotImplemented
+
+        # The result does not fit in the existing buffer, or the buffer is
+        # read only.
+        self.coefficients = (self + other).coefficients
+        return self
+
+    def __mul__(self, other):
+        if isinstance(other, Number):
+            return type(self)(self.coefficients.astype(
+                _scalar_result_type(self.coefficients, other), copy=False
+            ) * other)
+
+        elif isinstance(other, Polynomial):
+            return type(self)(_convolve(self.coefficients,
+                                        np.asarray(other.coefficients)))
+
+        else:
+            return NotImplemented
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __imul__(self, other):
+        if isinstance(other, Number):
+            if self.coefficients.flags.writeable and np.can_cast(
+                _scalar_result_type(self.coefficients, other),
+                self.coefficients.dtype
+            ):
+                self.coefficients *= other
+                return self
+
+        elif not isinstance(other, Polynomial):
+            return NotImplemented
+
+        # The product has a different length or dtype, or the buffer is read
+        # only, so a new buffer is needed.
+        self.coefficients = (self * other).coefficients
+        return self
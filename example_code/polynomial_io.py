@@ -0,0 +1,145 @@
+"""Reading and writing large collections of polynomials.
+
+Text files contain one polynomial per line, in the format produced by
+:meth:`Polynomial.__str__ <example_code.polynomial.Polynomial.__str__>`.
+
+Binary files store all of the coefficients in one contiguous buffer, so that
+they can be memory mapped and individual polynomials accessed without any
+parsing. The layout, with all integers little endian uint64, is:
+
+=========  ============================================================
+magic      The 8 bytes `b"POLYARC1"`.
+dtype      The NumPy dtype string of the coefficients, padded to 8 bytes.
+count      The number of polynomials.
+lengths    count integers giving the number of coefficients of each
+           polynomial.
+data       The coefficients of every polynomial, one after the other.
+=========  ============================================================
+"""
+
+from collections.abc import Sequence
+import numpy as np
+from example_code.polynomial import Polynomial, ArrayPolynomial
+
+MAGIC = b"POLYARC1"
+_HEADER_SIZE = 24
+
+
+def write_polynomials(file, polynomials):
+    """Write polynomials to a text file object, one per line.
+
+    The polynomials are formatted and written one at a time, so an iterable
+    of any length can be written without building the whole output in
+    memory.
+    """
+    file.writelines(f"{p}\n" for p in polynomials)
+
+
+def read_polynomials(file, cls=Polynomial):
+    """Generate polynomials from a text file object, one per line.
+
+    This is the inverse of :func:`write_polynomials`. Blank lines are
+    skipped.
+    """
+    for line in file:
+        if line.strip():
+            yield cls.from_string(line)
+
+
+def save_polynomials(file, polynomials, dtype=None):
+    """Save polynomials to a binary file.
+
+    Parameters
+    ----------
+    file: str or file object
+        The path of the file, or a binary file object opened for writing.
+    polynomials: iterable
+        The polynomials to be saved.
+    dtype: numpy.dtype
+        The dtype in which to store the coefficients. By default, the
+        common dtype of all the coefficients is used. Object dtypes, such as
+        Python integers too large for int64, cannot be saved.
+    """
+    arrays = [np.asarray(p.coefficients) for p in polynomials]
+    if dtype is None:
+        dtype = np.result_type(*arrays) if arrays else np.float64
+    dtype = np.dtype(dtype)
+    if dtype.hasobject:
+        raise TypeError("Polynomials with object coefficients cannot be "
+                        "saved in binary format.")
+    dtype_name = dtype.newbyteorder("<").str.encode()
+    if len(dtype_name) > 8:
+        raise TypeError(f"Unsupported coefficient dtype {dtype}")
+
+    if isinstance(file, str):
+        with open(file, "wb") as f:
+            return save_polynomials(f, map(ArrayPolynomial, arrays), dtype)
+
+    lengths = np.array([len(a) for a in arrays], dtype="<u8")
+    file.write(MAGIC)
+    file.write(dtype_name.ljust(8))
+    file.write(np.array(len(arrays), dtype="<u8").tobytes())
+    file.write(lengths.tobytes())
+    for a in arrays:
+        file.write(a.astype(dtype.newbyteorder("<"), copy=False).tobytes())
+
+
+class PolynomialArchive(Sequence):
+    """A read-only sequence of polynomials stored in a binary file.
+
+    The file is memory mapped, so opening an archive costs the same however
+    many polynomials it contains, and only the coefficients actually
+    accessed are read from disk. Each item is an
+    :class:`~example_code.polynomial.ArrayPolynomial` whose coefficients are
+    a view into the file.
+
+    Parameters
+    ----------
+    path: str
+        The path of a file written by :func:`save_polynomials`.
+
+    Attributes
+    ----------
+    lengths: numpy.ndarray
+        The number of coefficients of each polynomial.
+    offsets: numpy.ndarray
+        The position in data of the first coefficient of each polynomial,
+        followed by the total number of coefficients.
+    data: numpy.ndarray
+        The coefficients of all the polynomials, concatenated.
+    """
+
+    def __init__(self, path):
+        buffer = np.memmap(path, dtype=np.uint8, mode="r")
+        if bytes(buffer[:8]) != MAGIC:
+            raise ValueError(f"{path} is not a polynomial archive")
+        dtype = np.dtype(bytes(buffer[8:16]).strip().decode())
+        count = int(buffer[16:24].view("<u8")[0])
+        end = _HEADER_SIZE + 8 * count
+        self.path = path
+        self.lengths = buffer[_HEADER_SIZE:end].view("<u8")
+        self.offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(self.lengths, out=self.offsets[1:])
+        self.data = buffer[end:end + int(self.offsets[-1]) * dtype.itemsize]\
+            .view(dtype)
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("polynomial archive index out of range")
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        return ArrayPolynomial(self.data[start:stop])
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.path!r})"
+
+
+def load_polynomials(path):
+    """Open a binary polynomial file as a :class:`PolynomialArchive`."""
+    return PolynomialArchive(path)
@@ -0,0 +1,165 @@
+"""A polynomial representation for high degree polynomials with few terms.
+
+A :class:`SparsePolynomial` stores only its nonzero terms, so x^1000000 + 1
+costs two terms rather than a million coefficients. Sparse and dense
+:class:`~example_code.polynomial.Polynomial` objects can be mixed in
+arithmetic, in which case the result uses whichever representation suits
+its density.
+"""
+
+from heapq import merge
+from numbers import Number
+from example_code.polynomial import Polynomial
+
+# Results of mixed sparse and dense arithmetic with at least this fraction
+# of nonzero coefficients are returned as dense Polynomials.
+DENSITY_THRESHOLD = 0.5
+
+
+def _combine(terms):
+    """Sum the coefficients of an exponent-sorted stream of terms, dropping
+    zeros."""
+    result = []
+    for e, c in terms:
+        if result and result[-1][0] == e:
+            result[-1] = (e, result[-1][1] + c)
+        else:
+            if result and not result[-1][1]:
+                result.pop()
+            result.append((e, c))
+    if result and not result[-1][1]:
+        result.pop()
+    return tuple(result)
+
+
+def _scaled(terms, d, c):
+    """Generate the terms multiplied by the monomial cx^d."""
+    for e, f in terms:
+        yield d + e, c * f
+
+
+def choose_representation(p):
+    """Return p as a dense or sparse polynomial according to its density.
+
+    Parameters
+    ----------
+    p: Polynomial or SparsePolynomial
+        The polynomial to be converted.
+    """
+    if isinstance(p, Polynomial):
+        p = SparsePolynomial.from_dense(p)
+    if len(p.terms) >= DENSITY_THRESHOLD * (p.degree() + 1):
+        return p.to_dense()
+    else:
+        return p
+
+
+class SparsePolynomial:
+    """A polynomial stored as a sorted sequence of its nonzero terms.
+
+    Parameters
+    ----------
+    terms: dict or iterable
+        A mapping from exponents to coefficients, or an iterable of
+        (exponent, coefficient) pairs. Repeated exponents are summed and
+        zero coefficients are dropped.
+    """
+
+    __slots__ = ("terms",)
+
+    def __init__(self, terms):
+        if isinstance(terms, dict):
+            terms = terms.items()
+        terms = sorted(terms, key=lambda t: t[0])
+        if terms and terms[0][0] < 0:
+            raise ValueError("Polynomial exponents must be non-negative")
+        self.terms = _combine(terms)
+
+    @classmethod
+    def from_dense(cls, p):
+        """Create a SparsePolynomial from a dense :class:`Polynomial`."""
+        new = cls.__new__(cls)
+        new.terms = tuple((d, c) for d, c in enumerate(p.coefficients) if c)
+        return new
+
+    def to_dense(self):
+        """Return the equivalent dense :class:`Polynomial`."""
+        coefs = [0] * (self.degree() + 1)
+        for d, c in self.terms:
+            coefs[d] = c
+        return Polynomial(tuple(coefs))
+
+    def degree(self):
+        return self.terms[-1][0] if self.terms else 0
+
+    def __str__(self):
+        terms = []
+        for d, c in reversed(self.terms):
+            if d == 0:
+                terms.append(str(c))
+            elif d == 1:
+                terms.append(f"{c}x")
+            else:
+                terms.append(f"{'' if c == 1 else c}x^{d}")
+        return " + ".join(terms) or "0"
+
+    def __repr__(self):
+        return type(self).__name__ + "(" + repr(dict(self.terms)) + ")"
+
+    def __eq__(self, other):
+        if isinstance(other, Polynomial):
+            other = SparsePolynomial.from_dense(other)
+        return isinstance(other, SparsePolynomial) and \
+            self.terms == other.terms
+
+    def __add__(self, other):
+        if isinstance(other, Number):
+            return self + SparsePolynomial(((0, other),))
+
+        elif isinstance(other, SparsePolynomial):
+            new = SparsePolynomial.__new__(SparsePolynomial)
+            new.terms = _combine(merge(self.terms, other.terms,
+                                       key=lambda t: t[0]))
+            return new
+
+        elif isinstance(other, Polynomial):
+            return choose_representation(
+                self + SparsePolynomial.from_dense(other)
+            )
+
+        else:
+            return NotImplemented
+
+    def __radd__(self, other):
+        return self + other
+
+    def __mul__(self, other):
+        if isinstance(other, Number):
+            return SparsePolynomial((d, c * other) for d, c in self.terms)
+
+        elif isinstance(other, SparsePolynomial):
+            a, b = self.terms, other.terms
+            if len(a) > len(b):
+                a, b = b, a
+            # Each term of a times b is a sorted stream of terms. A heap
+            # merges these streams in exponent order.
+            streams = [_scaled(b, d, c) for d, c in a]
+            new = SparsePolynomial.__new__(SparsePolynomial)
+            new.terms = _combine(merge(*streams, key=lambda t: t[0]))
+            return new
+
+        elif isinstance(other, Polynomial):
+            if len(self.terms) >= DENSITY_THRESHOLD * (self.degree() + 1):
+                return self.to_dense() * other
+            return choose_representation(
+                self * SparsePolynomial.from_dense(other)
+            )
+
+        else:
+            return NotImplemented
+
+    def __rmul__(self, other):
+        return self * other
+
+    def __call__(self, x):
+        return sum(c * x ** d for d, c in self.terms)
@@ -1 +1,5 @@
 from .fibonacci import fib
+from .arrays import fib_array
+from .cache import FibCache, fib_cache
+from .stream import fib_range, fib_stream
+from .modular import fib_mod, fib_mod_array, pisano_period
@@ -0,0 +1,59 @@
+"""Fibonacci numbers at many indices at once using NumPy arrays."""
+
+import numpy as np
+from .fibonacci import fib
+
+
+def _fib_table(n):
+    """Return an array of the Fibonacci numbers F(0) to F(n-1)."""
+    table = [0, 1]
+    while len(table) < n:
+        table.append(table[-2] + table[-1])
+    return np.array(table[:n], dtype=np.uint64)
+
+
+# F(92) is the largest Fibonacci number representable as an int64, and F(93)
+# the largest representable as a uint64.
+_INT64_MAX_INDEX = 92
+_UINT64_MAX_INDEX = 93
+_table = _fib_table(_UINT64_MAX_INDEX + 1)
+
+
+def fib_array(ns):
+    """Return the Fibonacci numbers at each of the indices in ns.
+
+    Parameters
+    ----------
+    ns: array_like
+        An array of non-negative integer indices.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of the same shape as ns. If every result fits, the dtype is
+        int64 (or uint64 if F(93) is required). Otherwise the result is an
+        array of Python integers with dtype object.
+    """
+    ns = np.asarray(ns)
+    if ns.dtype != object and not np.issubdtype(ns.dtype, np.integer):
+        raise TypeError(
+            f"fib_array expects integer indices, not {ns.dtype}"
+        )
+    if ns.size == 0:
+        return np.zeros(ns.shape, dtype=np.int64)
+    if (ns < 0).any():
+        raise ValueError("fib_array expects non-negative indices")
+
+    top = ns.max()
+    if top <= _INT64_MAX_INDEX:
+        return _table[ns.astype(np.intp)].astype(np.int64)
+    elif top <= _UINT64_MAX_INDEX:
+        return _table[ns.astype(np.intp)]
+
+    # Some results need arbitrary precision integers. Compute each distinct
+    # index only once.
+    unique, inverse = np.unique(ns, return_inverse=True)
+    values = np.empty(unique.shape, dtype=object)
+    for i, n in enumerate(unique.tolist()):
+        values[i] = int(_table[n]) if n <= _UINT64_MAX_INDEX else fib(n)
+    return values[inverse].reshape(ns.shape)
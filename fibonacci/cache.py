@@ -0,0 +1,88 @@
+"""A bounded, thread-safe cache of Fibonacci numbers.
+
+A :class:`FibCache` can be passed to :func:`~fibonacci.fibonacci.fib` or
+:func:`~fibonacci.typesafe_fibonacci.typesafe_fib` using the `cache`
+keyword. The same cache may be shared between both functions, and between
+threads.
+"""
+
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+class FibCache:
+    """A least recently used cache mapping indices to Fibonacci numbers.
+
+    Parameters
+    ----------
+    maxsize: int
+        The maximum number of results to store. When the cache is full, the
+        least recently used result is evicted.
+    """
+
+    def __init__(self, maxsize=1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, n, compute):
+        """Return the cached result for n, calling compute() on a miss.
+
+        compute is called without the lock held, so a slow computation does
+        not block other threads from using the cache.
+        """
+        with self._lock:
+            try:
+                value = self._data[n]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._data.move_to_end(n)
+                self.hits += 1
+                return value
+
+        value = compute()
+
+        with self._lock:
+            self._data[n] = value
+            self._data.move_to_end(n)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def cache_info(self):
+        """Return the cache statistics as a named tuple."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._data))
+
+    def cache_clear(self):
+        """Empty the cache and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, n):
+        return n in self._data
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.maxsize!r})"
+
+
+# A cache which can be shared by all users of the Fibonacci functions.
+fib_cache = FibCache()
@@ -0,0 +1,179 @@
+"""A command line interface for computing Fibonacci numbers in bulk.
+
+Indices are read one per line from a file or standard input, processed in
+chunks, and the results are written out a chunk at a time. For example::
+
+    fibonacci indices.txt --mod 1000000007 --workers 4 --format jsonl
+"""
+
+import argparse
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import json
+import sys
+from .fibonacci import fib, _engines
+from .modular import fib_mod
+
+
+class InvalidIndexError(ValueError):
+    """An input line which is not a valid Fibonacci index."""
+
+
+@contextmanager
+def _unlimited_int_str():
+    """Allow integers of any size to be converted to strings in this block.
+
+    Python limits int to str conversion to 4300 digits by default, but
+    F(n) has more digits than that for n above about 20,577. The previous
+    limit is restored on exit.
+    """
+    if not hasattr(sys, "set_int_max_str_digits"):
+        yield
+        return
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        yield
+    finally:
+        sys.set_int_max_str_digits(limit)
+
+
+def _format_csv(n, value):
+    return f"{n},{value}\n"
+
+
+def _format_jsonl(n, value):
+    return json.dumps({"n": n, "fib": value}) + "\n"
+
+
+_formatters = {"csv": _format_csv, "jsonl": _format_jsonl}
+
+
+def process_chunk(lines, method="auto", mod=None, format="csv"):
+    """Compute the Fibonacci numbers for a chunk of input lines.
+
+    Parameters
+    ----------
+    lines: list of str
+        Lines each containing a single index. Blank lines are ignored.
+    method: str
+        The engine passed to :func:`~fibonacci.fibonacci.fib`.
+    mod: int
+        If not None, compute the results modulo mod using
+        :func:`~fibonacci.modular.fib_mod`. method is then ignored.
+    format: str
+        The output format, "csv" or "jsonl".
+
+    Returns
+    -------
+    str
+        The formatted results for the whole chunk.
+    """
+    formatter = _formatters[format]
+    output = []
+    with _unlimited_int_str():
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                n = int(line)
+            except ValueError:
+                n = -1
+            if n < 0:
+                raise InvalidIndexError(
+                    f"Invalid Fibonacci index: {line!r}"
+                )
+            if mod is None:
+                value = fib(n, method=method)
+            else:
+                value = fib_mod(n, mod, pisano=True)
+            output.append(formatter(n, value))
+    return "".join(output)
+
+
+def _chunks(lines, size):
+    """Split an iterable of lines into lists of at most size lines."""
+    lines = iter(lines)
+    while chunk := list(islice(lines, size)):
+        yield chunk
+
+
+def run(infile, outfile, method="auto", mod=None, format="csv",
+        workers=1, chunk_size=10000):
+    """Read indices from infile and write their Fibonacci numbers to outfile.
+
+    If workers is greater than 1 then chunks are processed in parallel in a
+    process pool. At most two chunks per worker are in flight at any one
+    time, so arbitrarily long inputs are streamed in bounded memory.
+    Results are always written in input order.
+    """
+    if format == "csv":
+        outfile.write("n,fib\n")
+    chunks = _chunks(infile, chunk_size)
+
+    if workers <= 1:
+        for chunk in chunks:
+            outfile.write(process_chunk(chunk, method, mod, format))
+        return
+
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(
+                pool.submit(process_chunk, chunk, method, mod, format)
+            )
+            if len(pending) >= 2 * workers:
+                outfile.write(pending.popleft().result())
+        while pending:
+            outfile.write(pending.popleft().result())
+
+
+def main(argv=None):
+    """Run the command line interface."""
+    parser = argparse.ArgumentParser(
+        prog="fibonacci",
+        description="Compute Fibonacci numbers for indices read one per "
+                    "line."
+    )
+    parser.add_argument("input", nargs="?", default="-",
+                        help="File of indices, or - for standard input "
+                             "(the default).")
+    parser.add_argument("-o", "--output", default="-",
+                        help="Output file, or - for standard output "
+                             "(the default).")
+    parser.add_argument("--method", choices=list(_engines), default=None,
+                        help="The Fibonacci engine to use. Not valid with "
+                             "--mod.")
+    parser.add_argument("--mod", type=int, default=None,
+                        help="Compute the results modulo this number.")
+    parser.add_argument("--format", choices=list(_formatters),
+                        default="csv", help="The output format.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="The number of worker processes.")
+    parser.add_argument("--chunk-size", type=int, default=10000,
+                        help="The number of indices in each chunk of work.")
+    args = parser.parse_args(argv)
+
+    if args.mod is not None and args.mod < 1:
+        parser.error("--mod must be a positive integer")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be a positive integer")
+    if args.mod is not None and args.method is not None:
+        parser.error("--method cannot be used with --mod")
+
+    infile = sys.stdin if args.input == "-" else open(args.input)
+    outfile = sys.stdout if args.output == "-" \
+        else open(args.output, "w", buffering=1 << 20)
+    try:
+        run(infile, outfile, args.method or "auto", args.mod, args.format,
+            args.workers, args.chunk_size)
+    except InvalidIndexError as e:
+        sys.exit(f"fibonacci: {e}")
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
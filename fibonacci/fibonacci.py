@@ -1,8 +1,130 @@
-def fib(n):
-    """Return the n-th Fibonacci number."""
+"""Fibonacci numbers computed by a choice of engines.
+
+The recursive definition is the most natural, but takes time exponential in
+n. The iterative engine takes O(n) additions, while the fast doubling and
+matrix power engines need only O(log n) big integer multiplications.
+"""
+
+
+def _fib_recursive(n):
+    """Return the n-th Fibonacci number using the recursive definition."""
     if n == 0:
         return 0
     elif n == 1:
         return 1
     else:
-        return fib(n-2) + fib(n-1)
+        return _fib_recursive(n-2) + _fib_recursive(n-1)
+
+
+def _fib_iterative(n):
+    """Return the n-th Fibonacci number by summing up the sequence."""
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def _fib_pair(n):
+    """Return the pair (F(n), F(n+1)) using fast doubling.
+
+    This uses the identities:
+
+        F(2k) = F(k) * (2F(k+1) - F(k))
+        F(2k+1) = F(k)^2 + F(k+1)^2
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a, b
+
+
+def _fib_doubling(n):
+    """Return the n-th Fibonacci number using fast doubling."""
+    return _fib_pair(n)[0]
+
+
+def _fib_matrix(n):
+    """Return the n-th Fibonacci number by raising a matrix to a power.
+
+    The n-th power of the matrix [[1, 1], [1, 0]] is
+    [[F(n+1), F(n)], [F(n), F(n-1)]]. Since the matrix is symmetric, only
+    three entries need be stored.
+    """
+    # Result and base matrices stored as (top left, off diagonal, bottom
+    # right).
+    r = (1, 0, 1)
+    m = (1, 1, 0)
+    while n:
+        if n & 1:
+            r = (r[0] * m[0] + r[1] * m[1],
+                 r[0] * m[1] + r[1] * m[2],
+                 r[1] * m[1] + r[2] * m[2])
+        m = (m[0] * m[0] + m[1] * m[1],
+             m[1] * (m[0] + m[2]),
+             m[1] * m[1] + m[2] * m[2])
+        n >>= 1
+    return r[1]
+
+
+# Below this index the iterative engine beats the logarithmic ones.
+_ITERATIVE_THRESHOLD = 64
+
+
+def _fib_auto(n):
+    """Return the n-th Fibonacci number using the fastest engine for n."""
+    if n < _ITERATIVE_THRESHOLD:
+        return _fib_iterative(n)
+    else:
+        return _fib_doubling(n)
+
+
+_engines = {
+    "auto": _fib_auto,
+    "recursive": _fib_recursive,
+    "iterative": _fib_iterative,
+    "doubling": _fib_doubling,
+    "matrix": _fib_matrix,
+}
+
+
+def fib(n, method="auto", cache=None):
+    """Return the n-th Fibonacci number.
+
+    Parameters
+    ----------
+    n: int
+        The index of the Fibonacci number required.
+    method: str
+        The engine used to compute the result. One of:
+
+        "auto"
+            Choose the fastest engine for the size of n.
+        "recursive"
+            The recursive definition. Exponential in n.
+        "iterative"
+            Sum the sequence up to n. O(n) additions.
+        "doubling"
+            Fast doubling. O(log n) multiplications.
+        "matrix"
+            Matrix exponentiation. O(log n) multiplications.
+    cache: FibCache
+        An optional :class:`~fibonacci.cache.FibCache` in which to look up
+        and store the result.
+    """
+    try:
+        engine = _engines[method]
+    except KeyError:
+        raise ValueError(
+            f"Unknown Fibonacci method {method!r}. "
+            f"Valid methods are: {', '.join(_engines)}"
+        ) from None
+    if n < 0:
+        raise ValueError(f"fib expects a non-negative integer, not {n}")
+    if cache is not None:
+        return cache.lookup(n, lambda: engine(n))
+    return engine(n)
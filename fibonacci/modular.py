@@ -0,0 +1,203 @@
+"""Fibonacci numbers modulo m, for very large indices.
+
+Fast doubling with modular reduction never builds numbers larger than m**2,
+so F(n) mod m takes O(log n) operations on small integers. The Fibonacci
+sequence modulo m is periodic, with period known as the Pisano period. If
+this is known, n can first be reduced modulo the period.
+"""
+
+from functools import lru_cache
+from itertools import count
+from math import gcd, lcm
+import numpy as np
+
+
+def _fib_pair_mod(n, m):
+    """Return the pair (F(n) mod m, F(n+1) mod m) using fast doubling."""
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a) % m
+        d = (a * a + b * b) % m
+        if bit == "1":
+            a, b = d, (c + d) % m
+        else:
+            a, b = c, d
+    return a, b
+
+
+def _is_prime(n):
+    """Return True if n is prime, using the Miller-Rabin test.
+
+    The bases used make the test deterministic for n < 3.3 * 10**24, and
+    very reliable beyond that.
+    """
+    if n < 2:
+        return False
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for p in bases:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for a in bases:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _find_factor(n):
+    """Return a non-trivial factor of the odd composite n using Pollard's
+    rho algorithm."""
+    for c in count(1):
+        x = y = 2
+        d = 1
+        while d == 1:
+            x = (x * x + c) % n
+            y = (y * y + c) % n
+            y = (y * y + c) % n
+            d = gcd(x - y, n)
+        if d != n:
+            return d
+
+
+def _factorise(n):
+    """Return a dict mapping the prime factors of n to their multiplicity."""
+    factors = {}
+    # Remove small factors by trial division.
+    for p in (2, 3, 5, 7, 11, 13):
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    stack = [n] if n > 1 else []
+    while stack:
+        n = stack.pop()
+        if _is_prime(n):
+            factors[n] = factors.get(n, 0) + 1
+        else:
+            d = _find_factor(n)
+            stack += [d, n // d]
+    return factors
+
+
+def _is_period(k, m):
+    """Return True if the Fibonacci sequence modulo m repeats after k."""
+    return _fib_pair_mod(k, m) == (0, 1 % m)
+
+
+@lru_cache(maxsize=1024)
+def pisano_period(m):
+    """Return the Pisano period of m.
+
+    This is the period of the sequence F(n) mod m. Results are cached, so
+    repeated queries with the same modulus are cheap.
+    """
+    if m < 1:
+        raise ValueError(f"The modulus must be a positive integer, not {m}")
+
+    # First find a multiple of the period. The period of p**k divides
+    # p**(k-1) times a multiple of the period of p, and the period of m is
+    # the lowest common multiple of the periods of its prime power factors.
+    multiple = 1
+    for p, k in _factorise(m).items():
+        if p == 2:
+            base = 3
+        elif p == 5:
+            base = 20
+        elif p % 5 in (1, 4):
+            base = p - 1
+        else:
+            base = 2 * (p + 1)
+        multiple = lcm(multiple, p ** (k - 1) * base)
+
+    # Now strip out any prime factors which are not needed.
+    period = multiple
+    for q in _factorise(multiple):
+        while period % q == 0 and _is_period(period // q, m):
+            period //= q
+    return period
+
+
+def fib_mod(n, m, pisano=False):
+    """Return the n-th Fibonacci number modulo m.
+
+    Parameters
+    ----------
+    n: int
+        The non-negative index of the Fibonacci number.
+    m: int
+        The positive modulus.
+    pisano: bool
+        If True, reduce n modulo the (cached) Pisano period of m before
+        computing. This pays off when many queries share a modulus.
+    """
+    if n < 0:
+        raise ValueError(f"fib_mod expects a non-negative index, not {n}")
+    if m < 1:
+        raise ValueError(f"The modulus must be a positive integer, not {m}")
+    if pisano:
+        n %= pisano_period(m)
+    return _fib_pair_mod(n, m)[0]
+
+
+# Moduli below this limit keep every intermediate product within uint64.
+_VECTOR_MODULUS_LIMIT = 2**32
+
+
+def fib_mod_array(ns, m, pisano=False):
+    """Return F(n) mod m for every index n in the array ns.
+
+    For moduli less than 2**32 and indices which fit in 64 bits, the fast
+    doubling iteration is applied to the whole array at once and the result
+    has dtype int64. Otherwise each index is computed separately and the
+    result is an array of Python integers.
+
+    Parameters
+    ----------
+    ns: array_like
+        An array of non-negative integer indices.
+    m: int
+        The positive modulus.
+    pisano: bool
+        If True, reduce the indices modulo the Pisano period of m first.
+    """
+    ns = np.asarray(ns)
+    if m < 1:
+        raise ValueError(f"The modulus must be a positive integer, not {m}")
+    if ns.dtype != object and not np.issubdtype(ns.dtype, np.integer):
+        raise TypeError(
+            f"fib_mod_array expects integer indices, not {ns.dtype}"
+        )
+    if ns.size and (ns < 0).any():
+        raise ValueError("fib_mod_array expects non-negative indices")
+    if pisano:
+        ns = ns % pisano_period(m)
+
+    if m >= _VECTOR_MODULUS_LIMIT or \
+            (ns.dtype == object and ns.size and ns.max() >= 2**64):
+        result = np.empty(ns.shape, dtype=object)
+        for i, n in np.ndenumerate(ns):
+            result[i] = _fib_pair_mod(int(n), m)[0]
+        return result
+
+    ns = ns.astype(np.uint64)
+    mod = np.uint64(m)
+    a = np.zeros(ns.shape, dtype=np.uint64)
+    b = np.ones(ns.shape, dtype=np.uint64) % mod
+    top = int(ns.max()).bit_length() if ns.size else 0
+    for bit in range(top - 1, -1, -1):
+        # c = a(2b - a) and d = a^2 + b^2, with every product reduced so
+        # that nothing overflows.
+        c = a * ((2 * b + mod - a) % mod) % mod
+        d = (a * a % mod + b * b % mod) % mod
+        odd = ((ns >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+        a = np.where(odd, d, c)
+        b = np.where(odd, (c + d) % mod, d)
+    return a.astype(np.int64)
@@ -0,0 +1,88 @@
+"""Iterate over consecutive Fibonacci numbers.
+
+Each successive value costs a single addition. The state of an iterator is
+just the current index, the two current values and the index at which it
+stops, so a long stream or range can be checkpointed with
+:attr:`FibIterator.state` and resumed later with :func:`fib_stream`.
+"""
+
+from .fibonacci import _fib_pair
+
+
+class FibIterator:
+    """An iterator over the Fibonacci numbers F(index), F(index+1), ...
+
+    Parameters
+    ----------
+    index: int
+        The index of the next Fibonacci number to be returned.
+    stop: int
+        If not None, stop before returning F(stop).
+    current: int
+        F(index). If current and following are not provided they are
+        computed from index.
+    following: int
+        F(index+1).
+    """
+
+    def __init__(self, index=0, stop=None, current=None, following=None):
+        if index < 0:
+            raise ValueError(f"Fibonacci index must be non-negative, "
+                             f"not {index}")
+        if current is None or following is None:
+            current, following = _fib_pair(index)
+        self.index = index
+        self.stop = stop
+        self.current = current
+        self.following = following
+
+    @property
+    def state(self):
+        """The tuple (index, F(index), F(index+1), stop) describing the
+        iterator."""
+        return (self.index, self.current, self.following, self.stop)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.stop is not None and self.index >= self.stop:
+            raise StopIteration
+        value = self.current
+        self.current, self.following = \
+            self.following, self.current + self.following
+        self.index += 1
+        return value
+
+    def __repr__(self):
+        return f"{type(self).__name__}{self.state!r}"
+
+
+def fib_stream(state=None):
+    """Return an iterator over the Fibonacci numbers.
+
+    Parameters
+    ----------
+    state: tuple
+        A state (index, F(index), F(index+1), stop) previously obtained from
+        :attr:`FibIterator.state`. If this is provided then the iterator
+        resumes from that point, and stops where the original iterator would
+        have stopped. Otherwise it starts at F(0) and is infinite. A state
+        (index, F(index), F(index+1)) without stop resumes an infinite
+        stream.
+    """
+    if state is None:
+        return FibIterator()
+    index, current, following, *stop = state
+    return FibIterator(index, *stop, current=current, following=following)
+
+
+def fib_range(start, stop=None):
+    """Return an iterator over F(start), ..., F(stop-1).
+
+    As with :class:`range`, if only one argument is given then it is taken
+    to be stop, and start is 0.
+    """
+    if stop is None:
+        start, stop = 0, start
+    return FibIterator(start, stop)
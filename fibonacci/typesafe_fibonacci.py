@@ -1,16 +1,27 @@
 from numbers import Integral
+import numpy as np
+from .fibonacci import fib
 
+# Types which are known to be integers without consulting the Integral ABC.
+_integer_types = frozenset((
+    int,
+    np.int8, np.int16, np.int32, np.int64, np.longlong, np.intp,
+    np.uint8, np.uint16, np.uint32, np.uint64, np.ulonglong, np.uintp,
+))
 
-def typesafe_fib(n):
+
+def typesafe_fib(n, method="auto", cache=None):
     """Return the n-th Fibonacci number, raising an exception if a
-    non-integer is passed as n."""
-    if not isinstance(n, Integral):
+    non-integer is passed as n.
+
+    The type of n is checked once, after which the computation is delegated
+    to :func:`~fibonacci.fibonacci.fib`. The method and cache arguments have
+    the same meaning as for that function."""
+    # Exact type lookup is much cheaper than an isinstance check against an
+    # ABC, so try that first.
+    if type(n) not in _integer_types and not isinstance(n, Integral):
         raise TypeError(
             f"fib expects an integer, not a {type(n).__name__}"
         )
-    if n == 0:
-        return 0
-    elif n == 1:
-        return 1
-    else:
-        return typesafe_fib(n-2) + typesafe_fib(n-1)
+    # Convert NumPy integers to Python integers to avoid overflow.
+    return fib(int(n), method=method, cache=cache)
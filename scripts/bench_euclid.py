@@ -0,0 +1,40 @@
+"""Compare the gcd engines in example_code.euclid with math.gcd."""
+
+import math
+import random
+from timeit import repeat
+import numpy as np
+from example_code.euclid import gcd, gcd_array
+
+random.seed(0)
+
+
+def best_time(stmt, number):
+    """Return the best time per call of stmt."""
+    return min(repeat(stmt, number=number, repeat=5)) / number
+
+
+print(f"{'bits':>6} {'math.gcd':>10} {'iterative':>10} {'binary':>10} "
+      f"{'recursive':>10}")
+for bits in (16, 64, 256, 1024, 4096):
+    pairs = [(random.getrandbits(bits), random.getrandbits(bits))
+             for _ in range(100)]
+    times = [best_time(lambda: [math.gcd(a, b) for a, b in pairs], 20)]
+    for method in ("iterative", "binary", "recursive"):
+        try:
+            times.append(best_time(
+                lambda: [gcd(a, b, method=method) for a, b in pairs], 20
+            ))
+        except RecursionError:
+            times.append(float("nan"))
+    print(f"{bits:>6} " + " ".join(f"{t / 100 * 1e6:>8.2f}us" for t in times))
+
+print()
+print(f"{'size':>8} {'math.gcd loop':>14} {'gcd_array':>10}")
+for size in (10, 1000, 100000):
+    a = np.random.default_rng(0).integers(1, 2**62, size)
+    b = np.random.default_rng(1).integers(1, 2**62, size)
+    loop = best_time(lambda: [math.gcd(x, y) for x, y in
+                              zip(a.tolist(), b.tolist())], 3)
+    vector = best_time(lambda: gcd_array(a, b), 3)
+    print(f"{size:>8} {loop * 1e3:>12.3f}ms {vector * 1e3:>8.3f}ms")
@@ -0,0 +1,28 @@
+"""Compare compiled expression evaluation with postvisitor and evaluate."""
+
+from timeit import repeat
+import numpy as np
+from example_code.expressions import Symbol
+from example_code.expression_tools import (evaluate, postvisitor,
+                                           compile_expression)
+
+x = Symbol("x")
+y = Symbol("y")
+expr = 2 * y + 4 ** (5 - x) / 2 - (x * y) * (x * y) + (x + y) / (x - y + 3)
+
+fn = compile_expression(expr)
+
+print(f"{'points':>8} {'postvisitor':>12} {'compiled':>12} {'speedup':>8}")
+for n in (1, 1000, 100000, 1000000):
+    xs = np.linspace(0, 1, n)
+    ys = np.linspace(-1, 2, n)
+    # The postvisitor is timed on a subset of the points and scaled up.
+    sample = min(n, 1000)
+    pairs = list(zip(xs[:sample].tolist(), ys[:sample].tolist()))
+    t_visit = min(repeat(
+        lambda: [postvisitor(expr, evaluate, symbol_map={"x": a, "y": b})
+                 for a, b in pairs],
+        number=1, repeat=3)) * n / sample
+    t_compiled = min(repeat(lambda: fn(x=xs, y=ys), number=1, repeat=3))
+    print(f"{n:>8} {t_visit * 1e3:>10.2f}ms {t_compiled * 1e3:>10.2f}ms "
+          f"{t_visit / t_compiled:>7.0f}x")
@@ -0,0 +1,45 @@
+"""Compare recursive and iterative tree visitors in example_code.graphs."""
+
+from timeit import repeat
+from example_code.graphs import (TreeNode, previsitor, postvisitor,
+                                 previsitor_iterative, postvisitor_iterative)
+
+
+def make_tree(depth, branching):
+    """Return a complete tree, or a chain if branching is 1."""
+    if branching == 1:
+        node = TreeNode(0)
+        for i in range(1, depth):
+            node = TreeNode(i, node)
+        return node
+    if depth == 1:
+        return TreeNode(0)
+    return TreeNode(0, *(make_tree(depth - 1, branching)
+                         for _ in range(branching)))
+
+
+def best_time(stmt):
+    """Return the best time for one run of stmt, or None on RecursionError."""
+    try:
+        return min(repeat(stmt, number=1, repeat=5))
+    except RecursionError:
+        return None
+
+
+def show(t):
+    return f"{t * 1e3:>9.2f}ms" if t is not None else f"{'overflow':>11}"
+
+
+count = lambda n, *c: sum(c) + 1  # noqa: E731
+depth_fn = lambda n, p: (p or 0) + 1  # noqa: E731
+
+print(f"{'depth':>6} {'branch':>6} {'pre rec':>11} {'pre iter':>11} "
+      f"{'post rec':>11} {'post iter':>11}")
+for depth, branching in ((10, 4), (14, 2), (7, 8), (100, 1), (900, 1),
+                         (10000, 1), (100000, 1)):
+    tree = make_tree(depth, branching)
+    times = (best_time(lambda: previsitor(tree, depth_fn)),
+             best_time(lambda: previsitor_iterative(tree, depth_fn)),
+             best_time(lambda: postvisitor(tree, count)),
+             best_time(lambda: postvisitor_iterative(tree, count)))
+    print(f"{depth:>6} {branching:>6} " + " ".join(map(show, times)))
@@ -0,0 +1,55 @@
+"""Time the Polynomial multiplication engines to tune their thresholds.
+
+For each family of coefficient types, the engines are timed on polynomials
+of increasing length, and the first length at which the faster algorithm
+wins is reported. The results can be used to set the thresholds in
+:mod:`example_code.polynomial`.
+"""
+
+from fractions import Fraction
+import random
+from timeit import repeat
+from example_code import polynomial
+
+random.seed(0)
+lengths = (4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+def best_time(fn, a, b):
+    """Return the best time for one call of fn(a, b)."""
+    number = 1
+    while min(repeat(lambda: fn(a, b), number=number, repeat=1)) < 0.05:
+        number *= 4
+    return min(repeat(lambda: fn(a, b), number=number, repeat=3)) / number
+
+
+def compare(name, make, slow, fast, max_length=lengths[-1]):
+    """Print timings of slow and fast, and the crossover length."""
+    print(f"{name}: {slow.__name__} against {fast.__name__}")
+    crossover = None
+    for n in lengths:
+        if n > max_length:
+            break
+        a = [make() for _ in range(n)]
+        b = [make() for _ in range(n)]
+        t_slow = best_time(slow, a, b)
+        t_fast = best_time(fast, a, b)
+        print(f"{n:>6} {t_slow * 1e3:>10.3f}ms {t_fast * 1e3:>10.3f}ms")
+        if crossover is None and t_fast < t_slow:
+            crossover = n
+    print(f"Crossover at length {crossover}\n")
+
+
+compare("integer",
+        lambda: random.randint(-10**9, 10**9),
+        polynomial._mul_schoolbook, polynomial._mul_kronecker)
+compare("fraction",
+        lambda: Fraction(random.randint(-99, 99), random.randint(1, 99)),
+        polynomial._mul_schoolbook, polynomial._mul_karatsuba,
+        max_length=256)
+compare("float",
+        lambda: random.uniform(-1, 1),
+        polynomial._mul_schoolbook, polynomial._mul_karatsuba)
+compare("float",
+        lambda: random.uniform(-1, 1),
+        polynomial._mul_karatsuba, polynomial._mul_fft)
@@ -0,0 +1,27 @@
+"""Measure the overhead of typesafe_fib compared with plain fib."""
+
+from timeit import repeat
+import numpy as np
+from fibonacci import fib
+from fibonacci.typesafe_fibonacci import typesafe_fib
+
+
+def best_time(fn, n, method, number):
+    """Return the best time per call of fn(n, method=method)."""
+    return min(repeat(lambda: fn(n, method=method),
+                      number=number, repeat=5)) / number
+
+
+print(f"{'method':>10} {'n':>6} {'argument':>8} {'fib':>10} "
+      f"{'typesafe':>10} {'overhead':>8}")
+for method, n, number in (("recursive", 15, 100),
+                          ("iterative", 20, 20000),
+                          ("iterative", 500, 2000),
+                          ("doubling", 20, 20000),
+                          ("doubling", 10000, 2000)):
+    for arg in (n, np.int64(n)):
+        plain = best_time(fib, int(arg), method, number)
+        safe = best_time(typesafe_fib, arg, method, number)
+        print(f"{method:>10} {n:>6} {type(arg).__name__:>8} "
+              f"{plain * 1e6:>8.2f}us {safe * 1e6:>8.2f}us "
+              f"{safe / plain:>7.2f}x")
@@ -1,3 +1,10 @@
-from fibonacci import fib
+"""Compute Fibonacci numbers from the command line.
 
-print(fib(4))
+This is equivalent to the `fibonacci` command installed with the package.
+Run with --help for the available options.
+"""
+
+from fibonacci.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import math
+import numpy as np
+import pytest
+from example_code.euclid import (gcd, gcd_many, lcm, lcm_many, gcd_array,
+                                 extended_gcd, modinv, extended_gcd_array,
+                                 modinv_array)
+
+pairs = [(10, 12), (12, 10), (0, 5), (5, 0), (0, 0), (17, 5), (-12, 18),
+         (2**100 * 3, 2**80 * 9), (math.factorial(50), 2**61 - 1)]
+
+
+@pytest.mark.parametrize("method", ("iterative", "binary"))
+@pytest.mark.parametrize("a, b", pairs)
+def test_gcd(method, a, b):
+    assert gcd(a, b, method=method) == math.gcd(a, b)
+
+
+def test_gcd_recursive():
+    assert gcd(10, 12, method="recursive") == 2
+
+
+def test_gcd_deep():
+    # Consecutive Fibonacci numbers are the worst case for Euclid.
+    a, b = 0, 1
+    for _ in range(5000):
+        a, b = b, a + b
+    assert gcd(a, b) == 1
+
+
+def test_gcd_many():
+    assert gcd_many([12, 18, 30]) == 6
+    assert gcd_many([]) == 0
+    assert gcd_many(iter([4, 7, 8]), method="binary") == 1
+
+
+def test_lcm():
+    assert lcm(4, 6) == 12
+    assert lcm(0, 6) == 0
+    assert lcm_many([2, 3, 4]) == 12
+    assert lcm_many([]) == 1
+
+
+def test_gcd_array():
+    a = np.array([10, 12, 0, 17])
+    assert list(gcd_array(a, 4)) == [2, 4, 4, 1]
+    big = np.array([2**100, 3**70], dtype=object)
+    assert list(gcd_array(big, 2**70 * 3)) == [2**70, 3]
+    with pytest.raises(TypeError):
+        gcd_array([1.5], [2])
+
+
+def test_gcd_array_mixed_sign():
+    a = np.array([2**63 + 6, 12], dtype=np.uint64)
+    b = np.array([4, -18], dtype=np.int64)
+    assert list(gcd_array(a, b)) == [2, 6]
+
+
+@pytest.mark.parametrize("fn", (gcd_many, lcm_many))
+def test_unknown_method(fn):
+    with pytest.raises(ValueError, match="Valid methods"):
+        fn([4, 6], method="fast")
+    with pytest.raises(ValueError, match="Valid methods"):
+        fn([], method="fast")
+
+
+@pytest.mark.parametrize("a, b", pairs)
+def test_extended_gcd(a, b):
+    g, x, y = extended_gcd(a, b)
+    assert g == math.gcd(a, b)
+    assert a * x + b * y == g
+
+
+def test_modinv():
+    assert modinv(3, 7) == 5
+    assert modinv(-3, 7) == 2
+    assert modinv(2**100 + 1, 2**61 - 1) * (2**100 + 1) % (2**61 - 1) == 1
+    with pytest.raises(ValueError):
+        modinv(4, 8)
+
+
+def test_extended_gcd_array():
+    rng = np.random.default_rng(0)
+    a = rng.integers(-10**9, 10**9, 1000)
+    b = rng.integers(-10**9, 10**9, 1000)
+    a[:3] = 0
+    b[1:4] = 0
+    g, x, y = extended_gcd_array(a, b)
+    assert (g == np.gcd(a, b)).all()
+    assert (a * x + b * y == g).all()
+
+
+def test_extended_gcd_array_object():
+    a = np.array([2**100, 12], dtype=object)
+    g, x, y = extended_gcd_array(a, 2**70 * 3)
+    assert list(g) == [2**70, 12]
+    assert list(a * x + 2**70 * 3 * y) == list(g)
+
+
+def test_extended_gcd_array_uint64():
+    a = np.array([2**63 + 5, 12], dtype=np.uint64)
+    b = np.array([2**62 + 3, 18], dtype=np.uint64)
+    g, x, y = extended_gcd_array(a, b)
+    assert list(g) == [math.gcd(2**63 + 5, 2**62 + 3), 6]
+    assert list(a.astype(object) * x + b.astype(object) * y) == list(g)
+
+
+def test_modinv_array_uint64():
+    a = np.array([3, 2**63 + 1], dtype=np.uint64)
+    m = 2**64 - 59
+    assert list(modinv_array(a, np.uint64(m))) == \
+        [modinv(3, m), modinv(2**63 + 1, m)]
+
+
+def test_modinv_array():
+    assert list(modinv_array([1, 2, 3, 4, 5, 6], 7)) == \
+        [modinv(n, 7) for n in range(1, 7)]
+    with pytest.raises(ValueError):
+        modinv_array([2, 3], 4)
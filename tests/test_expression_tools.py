@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+from example_code import expressions
+from example_code.expressions import Symbol, Number
+from example_code.expression_tools import (evaluate, postvisitor,
+                                           memoized_postvisitor,
+                                           compile_expression,
+                                           IncrementalEvaluator,
+                                           evaluate_many)
+
+
+@pytest.fixture
+def expr():
+    x = Symbol("x")
+    y = Symbol("y")
+    return 2 * y + 4 ** (5 - x) / 2 - (x * y) * (x * y)
+
+
+def test_compile_scalar(expr):
+    fn = compile_expression(expr)
+    symbol_map = {"x": 3, "y": 1.5}
+    assert fn(symbol_map) == postvisitor(expr, evaluate,
+                                         symbol_map=symbol_map)
+    assert fn(x=3, y=1.5) == fn(symbol_map)
+    assert set(fn.symbols) == {"x", "y"}
+
+
+def test_compile_shared(expr):
+    # x * y appears twice but is computed once.
+    assert compile_expression(expr).source.count(" * ") == 3
+
+
+def test_compile_array(expr):
+    x = np.linspace(0, 1, 1000)
+    y = np.linspace(-1, 2, 1000)
+    values = compile_expression(expr)(x=x, y=y)
+    assert values.shape == (1000,)
+    expected = [postvisitor(expr, evaluate, symbol_map={"x": a, "y": b})
+                for a, b in zip(x, y)]
+    assert np.allclose(values, expected)
+
+
+def test_compile_custom_node():
+    class Neg(expressions.Operator):
+        __slots__ = ()
+
+    @evaluate.register(Neg)
+    def _(expr, *o, **kwargs):
+        return -o[0]
+
+    expr = Neg(Symbol("x")) + 1
+    assert compile_expression(expr)(x=np.arange(3.0)).tolist() == \
+        [1.0, 0.0, -1.0]
+
+
+def test_memoized_postvisitor(expr):
+    symbol_map = {"x": 3, "y": 1.5}
+    assert memoized_postvisitor(expr, evaluate, symbol_map=symbol_map) == \
+        postvisitor(expr, evaluate, symbol_map=symbol_map)
+
+
+def test_memoized_postvisitor_shared():
+    expr = Symbol("x")
+    for _ in range(100):
+        expr = expr * expr + 1
+    calls = []
+
+    def count(node, *o):
+        calls.append(node)
+        return 1 + sum(o)
+
+    # 2**102 - 3 nodes counting repetitions, but only 202 distinct nodes.
+    assert memoized_postvisitor(expr, count) == 2**102 - 3
+    assert len(calls) == 202
+
+
+def test_memoized_postvisitor_deep():
+    expr = Symbol("x")
+    for i in range(20000):
+        expr = expr + i
+    assert memoized_postvisitor(expr, evaluate, symbol_map={"x": 1}) == \
+        1 + sum(range(20000))
+
+
+def test_incremental_evaluator(expr):
+    symbol_map = {"x": 3, "y": 1.5}
+    evaluator = IncrementalEvaluator(expr, symbol_map)
+    assert evaluator.value == postvisitor(expr, evaluate,
+                                          symbol_map=symbol_map)
+    evaluator.update(y=-2)
+    assert evaluator.value == postvisitor(expr, evaluate,
+                                          symbol_map={"x": 3, "y": -2})
+    assert evaluator.update({"x": 1}) == \
+        postvisitor(expr, evaluate, symbol_map={"x": 1, "y": -2})
+
+
+def test_incremental_evaluator_dirty_nodes():
+    calls = []
+
+    class Traced(expressions.Operator):
+        __slots__ = ()
+
+    @evaluate.register(Traced)
+    def _(expr, *o, **kwargs):
+        calls.append(expr)
+        return sum(o)
+
+    a, b = Symbol("a"), Symbol("b")
+    left = Traced(a, a)
+    right = Traced(b, b)
+    root = Traced(left, right)
+    evaluator = IncrementalEvaluator(root, {"a": 1, "b": 2})
+    assert evaluator.value == 6
+    calls.clear()
+    assert evaluator.update(b=5) == 12
+    assert calls == [right, root]
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 7), (2, 7), (2, 1000)])
+def test_evaluate_many(expr, workers, chunk_size):
+    table = {"x": np.arange(50) / 10, "y": np.linspace(-1, 1, 50),
+             "z": np.zeros(50)}
+    result = evaluate_many(expr, table, workers=workers,
+                           chunk_size=chunk_size)
+    expected = [postvisitor(expr, evaluate, symbol_map={"x": x, "y": y})
+                for x, y in zip(table["x"], table["y"])]
+    assert result.shape == (50,)
+    assert np.allclose(result, expected)
+
+
+def test_evaluate_many_constant():
+    assert np.array_equal(evaluate_many(Number(2) * 3, {"x": [1, 2, 3]}),
+                          [6, 6, 6])
+    with pytest.raises(ValueError, match="number of rows"):
+        evaluate_many(Number(2) * 3, {})
+
+
+def test_evaluate_many_ragged(expr):
+    with pytest.raises(ValueError):
+        evaluate_many(expr, {"x": [1, 2], "y": [1, 2, 3]})
@@ -0,0 +1,85 @@
+import gc
+import pickle
+import pytest
+from example_code.expressions import (Expression, Number, Symbol, Add, Sub,
+                                      Mul, Div, Pow)
+from example_code.expression_tools import evaluate, postvisitor
+
+
+def test_build():
+    x = Symbol("x")
+    y = Symbol("y")
+    expr = 2 * y + 4 ** (5 + x)
+    assert isinstance(expr, Add)
+    assert repr(expr) == "Add(Mul(Number(2), Symbol('y')), " \
+        "Pow(Number(4), Add(Number(5), Symbol('x'))))"
+    assert str(expr) == "2 * y + 4 ^ (5 + x)"
+
+
+@pytest.mark.parametrize("expr, string", (
+    (Sub(Symbol("a"), Sub(Symbol("b"), Symbol("c"))), "a - (b - c)"),
+    (Sub(Sub(Symbol("a"), Symbol("b")), Symbol("c")), "a - b - c"),
+    (Pow(Pow(Symbol("a"), Symbol("b")), Symbol("c")), "(a ^ b) ^ c"),
+    (Div(Symbol("a"), Mul(Symbol("b"), Symbol("c"))), "a / (b * c)"),
+    (Mul(Add(Symbol("a"), Number(1)), Symbol("c")), "(a + 1) * c"),
+))
+def test_str_brackets(expr, string):
+    assert str(expr) == string
+
+
+def test_hash_consing():
+    x = Symbol("x")
+    assert Symbol("x") is x
+    assert (x + 1) * (x + 1) is Mul(Add(x, Number(1)), Add(x, Number(1)))
+    e = (x + 1) * (x + 1)
+    assert e.operands[0] is e.operands[1]
+    assert Number(1) is not Number(1.0)
+    assert hash(x * 2) == hash(Mul(Symbol("x"), Number(2)))
+    assert len({x + 1, x + 1, x + 2}) == 2
+
+
+@pytest.mark.parametrize("zero, negative_zero",
+                         [(0.0, -0.0), (0j, complex(0, -0.0)),
+                          (0j, complex(-0.0, 0))])
+def test_signed_zeros_are_distinct(zero, negative_zero):
+    a = Number(zero)
+    b = Number(negative_zero)
+    assert a is not b
+    assert str(b.value) == str(negative_zero)
+    assert Number(negative_zero) is b
+
+
+def test_interned_nodes_are_released():
+    before = len([o for o in gc.get_objects() if isinstance(o, Expression)])
+    expr = Symbol("unique_symbol_name") + 123456
+    del expr
+    gc.collect()
+    after = len([o for o in gc.get_objects() if isinstance(o, Expression)])
+    assert after <= before
+
+
+def test_immutable():
+    x = Symbol("x")
+    with pytest.raises(AttributeError):
+        x.value = "y"
+
+
+def test_pickle():
+    expr = Symbol("x") ** 2 - 3 / Symbol("y")
+    assert pickle.loads(pickle.dumps(expr)) is expr
+
+
+def test_validation():
+    with pytest.raises(TypeError):
+        Number("1")
+    with pytest.raises(TypeError):
+        Symbol(1)
+    with pytest.raises(TypeError):
+        Add(Symbol("x"), 1)
+
+
+def test_evaluate():
+    x = Symbol("x")
+    y = Symbol("y")
+    expr = 2 * y + 4 ** (5 - x) / 2
+    assert postvisitor(expr, evaluate, symbol_map={"x": 3, "y": 1.5}) == 11
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from fibonacci import fib, fib_array
+
+
+def test_fib_array_int64():
+    ns = np.arange(93).reshape(3, 31)
+    result = fib_array(ns)
+    assert result.dtype == np.int64
+    assert result.shape == ns.shape
+    assert [int(f) for f in result.flat] == [fib(n) for n in range(93)]
+
+
+def test_fib_array_uint64():
+    result = fib_array([0, 93])
+    assert result.dtype == np.uint64
+    assert int(result[1]) == fib(93)
+
+
+def test_fib_array_bigint():
+    ns = np.array([5, 200, 5, 1000])
+    result = fib_array(ns)
+    assert result.dtype == object
+    assert list(result) == [fib(n) for n in ns.tolist()]
+
+
+def test_fib_array_negative():
+    with pytest.raises(ValueError):
+        fib_array([3, -1])
+
+
+def test_fib_array_float():
+    with pytest.raises(TypeError):
+        fib_array([1.0])
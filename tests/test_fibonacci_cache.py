@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from fibonacci import fib, FibCache
+from fibonacci.typesafe_fibonacci import typesafe_fib
+
+
+def test_cache_hits_and_misses():
+    cache = FibCache(maxsize=4)
+    assert fib(10, cache=cache) == 55
+    assert fib(10, cache=cache) == 55
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_cache_shared_with_typesafe_fib():
+    cache = FibCache()
+    fib(12, cache=cache)
+    assert typesafe_fib(12, cache=cache) == 144
+    assert cache.cache_info().hits == 1
+
+
+def test_cache_eviction():
+    cache = FibCache(maxsize=3)
+    for n in range(5):
+        fib(n, cache=cache)
+    # Touch 2 so that 3 is the least recently used.
+    fib(2, cache=cache)
+    fib(5, cache=cache)
+    assert cache.cache_info().evictions == 3
+    assert 2 in cache and 3 not in cache
+    assert len(cache) == 3
+
+
+def test_cache_clear():
+    cache = FibCache()
+    fib(7, cache=cache)
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 0, cache.maxsize, 0)
+
+
+def test_cache_threads():
+    cache = FibCache(maxsize=50)
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda n: fib(n % 100, cache=cache),
+                                range(2000)))
+    assert results == [fib(n % 100) for n in range(2000)]
+    info = cache.cache_info()
+    assert info.hits + info.misses == 2000
+    assert info.currsize <= 50
+
+
+def test_cache_bad_size():
+    with pytest.raises(ValueError):
+        FibCache(0)
@@ -0,0 +1,74 @@
+import io
+import json
+import sys
+import pytest
+from fibonacci import fib
+from fibonacci.cli import main, run, _unlimited_int_str
+
+
+def test_run_csv():
+    out = io.StringIO()
+    run(io.StringIO("3\n\n10\n"), out)
+    assert out.getvalue() == "n,fib\n3,2\n10,55\n"
+
+
+def test_run_jsonl_mod():
+    out = io.StringIO()
+    run(io.StringIO("100\n5\n"), out, mod=7, format="jsonl")
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == \
+        [{"n": 100, "fib": fib(100) % 7}, {"n": 5, "fib": 5}]
+
+
+def test_main_workers(tmp_path):
+    indices = tmp_path / "indices.txt"
+    indices.write_text("\n".join(map(str, range(200))))
+    output = tmp_path / "out.csv"
+    main([str(indices), "-o", str(output), "--workers", "2",
+          "--chunk-size", "7", "--method", "iterative"])
+    lines = output.read_text().splitlines()
+    assert lines[0] == "n,fib"
+    assert lines[1:] == [f"{n},{fib(n)}" for n in range(200)]
+
+
+def test_main_bad_index(tmp_path):
+    indices = tmp_path / "indices.txt"
+    indices.write_text("1\nx\n")
+    with pytest.raises(SystemExit):
+        main([str(indices), "-o", str(tmp_path / "out.csv")])
+
+
+def test_main_negative_index(tmp_path):
+    indices = tmp_path / "indices.txt"
+    indices.write_text("1\n-3\n")
+    with pytest.raises(SystemExit):
+        main([str(indices), "-o", str(tmp_path / "out.csv")])
+
+
+@pytest.mark.parametrize("format", ["csv", "jsonl"])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_main_large_index(tmp_path, format, workers):
+    indices = tmp_path / "indices.txt"
+    indices.write_text("25000\n")
+    out = tmp_path / "out"
+    main([str(indices), "-o", str(out), "--format", format,
+          "--workers", str(workers)])
+    text = out.read_text()
+    with _unlimited_int_str():
+        if format == "csv":
+            assert text.splitlines()[1] == f"25000,{fib(25000)}"
+        else:
+            assert json.loads(text)["fib"] == fib(25000)
+
+
+def test_run_large_index():
+    limit = sys.get_int_max_str_digits()
+    out = io.StringIO()
+    run(io.StringIO("25000\n"), out)
+    assert sys.get_int_max_str_digits() == limit
+    with _unlimited_int_str():
+        assert out.getvalue().splitlines()[1] == f"25000,{fib(25000)}"
+
+
+def test_main_method_with_mod():
+    with pytest.raises(SystemExit):
+        main(["--method", "matrix", "--mod", "7"])
@@ -0,0 +1,27 @@
+import pytest
+from fibonacci import fib
+
+
+methods = ("recursive", "iterative", "doubling", "matrix", "auto")
+
+
+@pytest.mark.parametrize("method", methods)
+@pytest.mark.parametrize("n, ans", enumerate((0, 1, 1, 2, 3, 5, 8, 13, 21)))
+def test_fibonacci_methods(method, n, ans):
+    assert fib(n, method=method) == ans
+
+
+@pytest.mark.parametrize("method", ("iterative", "doubling", "matrix"))
+def test_fibonacci_large(method):
+    assert fib(1000, method=method) == fib(1000, method="iterative")
+    assert str(fib(1000, method=method)).startswith("43466557686937456")
+
+
+def test_fibonacci_bad_method():
+    with pytest.raises(ValueError):
+        fib(3, method="guess")
+
+
+def test_fibonacci_negative():
+    with pytest.raises(ValueError):
+        fib(-1)
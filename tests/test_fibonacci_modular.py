@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from fibonacci import fib, fib_mod, fib_mod_array, pisano_period
+
+
+def naive_pisano(m):
+    a, b, k = 0, 1 % m, 0
+    while True:
+        a, b, k = b, (a + b) % m, k + 1
+        if (a, b) == (0, 1 % m):
+            return k
+
+
+@pytest.mark.parametrize("m", list(range(1, 60)) + [97, 100, 625, 1024])
+def test_pisano_period(m):
+    assert pisano_period(m) == naive_pisano(m)
+
+
+@pytest.mark.parametrize("pisano", (False, True))
+@pytest.mark.parametrize("m", (1, 2, 10, 1000, 10**9 + 7, 2**61 - 1))
+def test_fib_mod(m, pisano):
+    for n in (0, 1, 2, 50, 517):
+        assert fib_mod(n, m, pisano=pisano) == fib(n) % m
+
+
+def test_fib_mod_huge_index():
+    n = 10**18
+    assert fib_mod(n, 1000, pisano=True) == fib_mod(n, 1000)
+
+
+@pytest.mark.parametrize("pisano", (False, True))
+@pytest.mark.parametrize("m", (7, 10**9 + 7, 2**32 - 5, 2**40))
+def test_fib_mod_array(m, pisano):
+    ns = np.array([[0, 1, 2], [93, 300, 10**6]])
+    result = fib_mod_array(ns, m, pisano=pisano)
+    assert result.shape == ns.shape
+    assert [int(r) for r in result.flat] == \
+        [fib_mod(n, m) for n in ns.flat]
+
+
+def test_fib_mod_array_big_index():
+    ns = np.array([2**70, 5], dtype=object)
+    assert list(fib_mod_array(ns, 100)) == [fib_mod(2**70, 100), 5]
@@ -0,0 +1,35 @@
+from itertools import islice
+import pickle
+from fibonacci import fib, fib_range, fib_stream
+
+
+def test_fib_range():
+    assert list(fib_range(10, 20)) == [fib(n) for n in range(10, 20)]
+    assert list(fib_range(7)) == [0, 1, 1, 2, 3, 5, 8]
+    assert list(fib_range(5, 5)) == []
+
+
+def test_fib_stream():
+    assert list(islice(fib_stream(), 50)) == [fib(n) for n in range(50)]
+
+
+def test_fib_stream_resume():
+    stream = fib_stream()
+    first = list(islice(stream, 30))
+    state = pickle.loads(pickle.dumps(stream.state))
+    assert state == (30, fib(30), fib(31), None)
+    resumed = fib_stream(state)
+    assert first + list(islice(resumed, 10)) == \
+        [fib(n) for n in range(40)]
+
+
+def test_fib_range_resume():
+    numbers = fib_range(5, 25)
+    first = list(islice(numbers, 10))
+    resumed = fib_stream(pickle.loads(pickle.dumps(numbers.state)))
+    assert first + list(resumed) == [fib(n) for n in range(5, 25)]
+
+
+def test_fib_stream_resume_without_stop():
+    resumed = fib_stream((30, fib(30), fib(31)))
+    assert list(islice(resumed, 3)) == [fib(n) for n in range(30, 33)]
@@ -0,0 +1,73 @@
+import numpy as np
+from example_code.graphs import TreeNode, postvisitor
+from example_code.flat_tree import FlatTree
+
+
+def make_tree():
+    return TreeNode(1, TreeNode(2, TreeNode(4), TreeNode(5), TreeNode(6)),
+                    TreeNode(3, TreeNode(7, TreeNode(8))))
+
+
+def test_round_trip():
+    tree = make_tree()
+    flat = FlatTree.from_treenode(tree)
+    assert len(flat) == 8
+    assert list(flat.values) == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert list(flat.parent) == [-1, 0, 0, 1, 1, 1, 2, 6]
+    assert list(flat.children(1)) == [3, 4, 5]
+    assert repr(flat.to_treenode()) == repr(tree)
+
+
+def test_aggregations():
+    flat = FlatTree.from_treenode(make_tree())
+    assert list(flat.depths()) == [0, 1, 1, 2, 2, 2, 2, 3]
+    assert list(flat.subtree_sizes()) == [8, 4, 3, 1, 1, 1, 2, 1]
+    sums = postvisitor(make_tree(), lambda n, *c: n.value + sum(c))
+    assert flat.subtree_sums()[0] == sums
+    assert list(flat.subtree_sums()) == [36, 17, 18, 4, 5, 6, 15, 8]
+
+
+def test_previsitor():
+    flat = FlatTree.from_treenode(make_tree())
+    # Sum of values on the path from the root.
+    path = flat.previsitor(lambda nodes, p: p + flat.values[nodes],
+                           root_input=0)
+    assert list(path) == [1, 3, 4, 7, 8, 9, 11, 19]
+
+
+def test_postvisitor_max():
+    flat = FlatTree.from_treenode(make_tree())
+    height = flat.postvisitor(lambda nodes, c: c + 1, reduce=np.maximum,
+                              identity=-1)
+    assert list(height) == [3, 1, 2, 0, 0, 0, 1, 0]
+
+
+def test_previsitor_promotes():
+    flat = FlatTree.from_treenode(TreeNode(1, TreeNode(2, TreeNode(3))))
+    halves = flat.previsitor(
+        lambda nodes, p: np.ones(len(nodes), dtype=int) if p[0] is None
+        else p / 2
+    )
+    assert list(halves) == [1, 0.5, 0.25]
+
+
+def test_postvisitor_promotes():
+    flat = FlatTree.from_treenode(TreeNode(1, TreeNode(2, TreeNode(3))))
+    # The leaf is an int, and each parent halves the sum of its children.
+    halves = flat.postvisitor(
+        lambda nodes, c: np.ones(len(nodes), dtype=int) if nodes[0] == 2
+        else c * 0.5
+    )
+    assert list(halves) == [0.25, 0.5, 1]
+
+
+def test_string_values():
+    flat = FlatTree.from_treenode(TreeNode("a", TreeNode("bc")))
+    assert flat.to_treenode().children[0].value == "bc"
+
+
+def test_tuple_values():
+    tree = TreeNode((1, 2), TreeNode((3, 4)), TreeNode((5,)))
+    flat = FlatTree.from_treenode(tree)
+    assert flat.values.shape == (3,)
+    assert repr(flat.to_treenode()) == repr(tree)
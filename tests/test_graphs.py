@@ -0,0 +1,120 @@
+import io
+import pytest
+from example_code.graphs import (TreeNode, previsitor, postvisitor,
+                                 previsitor_iterative, postvisitor_iterative,
+                                 topological_order, dag_postvisitor,
+                                 iter_preorder, iter_postorder, iter_bfs,
+                                 write_tree)
+
+
+@pytest.fixture
+def tree():
+    return TreeNode("a", TreeNode("b", TreeNode("d"), TreeNode("e"),
+                                  TreeNode("f")),
+                    TreeNode("c", TreeNode("g")))
+
+
+def chain(depth):
+    node = TreeNode(0)
+    for i in range(1, depth):
+        node = TreeNode(i, node)
+    return node
+
+
+def test_previsitor_iterative(tree):
+    def fn(node, p):
+        depth = p + 1 if p else 1
+        log.append((node.value, depth))
+        return depth
+
+    log = []
+    previsitor(tree, fn)
+    expected = list(log)
+    log.clear()
+    previsitor_iterative(tree, fn)
+    assert log == expected
+
+
+def test_postvisitor_iterative(tree):
+    def fn(node, *c):
+        log.append(node.value)
+        return node.value + "(" + ",".join(c) + ")"
+
+    log = []
+    expected = postvisitor(tree, fn)
+    expected_log = list(log)
+    log.clear()
+    assert postvisitor_iterative(tree, fn) == expected
+    assert log == expected_log
+
+
+def test_deep_tree():
+    tree = chain(100000)
+    assert postvisitor_iterative(tree, lambda n, *c: sum(c) + 1) == 100000
+    depths = []
+    previsitor_iterative(tree, lambda n, p: depths.append(p or 0) or
+                         (p or 0) + 1)
+    assert depths[-1] == 99999
+
+
+def diamonds(depth):
+    node = TreeNode(0)
+    for i in range(1, depth):
+        node = TreeNode(i, node, node)
+    return node
+
+
+def test_topological_order():
+    shared = TreeNode("s")
+    tree = TreeNode("a", TreeNode("b", shared), TreeNode("c", shared))
+    assert [n.value for n in topological_order(tree)] == ["s", "b", "c", "a"]
+
+
+def test_dag_postvisitor(tree):
+    fn = lambda n, *c: sum(c) + 1  # noqa: E731
+    assert dag_postvisitor(tree, fn) == postvisitor(tree, fn)
+
+
+def test_dag_postvisitor_shared():
+    dag = diamonds(200)
+    calls = []
+
+    def paths(node, *c):
+        calls.append(node)
+        return sum(c) or 1
+
+    order = topological_order(dag)
+    assert len(order) == 200
+    assert dag_postvisitor(dag, paths, order) == 2**199
+    assert dag_postvisitor(dag, paths, order) == 2**199
+    assert len(calls) == 400
+
+
+def test_iterators(tree):
+    assert [n.value for n in iter_preorder(tree)] == list("abdefcg")
+    assert [n.value for n in iter_postorder(tree)] == list("defbgca")
+    assert [n.value for n in iter_bfs(tree)] == list("abcdefg")
+
+
+def test_iterators_early_exit():
+    tree = chain(100000)
+    assert next(n for n in iter_preorder(tree) if n.value == 99990).value \
+        == 99990
+    assert next(iter_postorder(tree)).value == 0
+
+
+def test_write_tree(tree):
+    file = io.StringIO()
+    write_tree(tree, file, chunk_size=4)
+    assert file.getvalue() == str(tree)
+    strings = TreeNode("x", "plain", TreeNode("y"))
+    file = io.StringIO()
+    write_tree(strings, file)
+    assert file.getvalue() == str(strings)
+
+
+def test_write_deep_tree():
+    file = io.StringIO()
+    write_tree(chain(50000), file)
+    assert file.getvalue().startswith("49999 -> (49998 -> (")
+    assert file.getvalue().endswith("0 -> ()" + ")" * 49999)
@@ -0,0 +1,256 @@
+from fractions import Fraction
+import operator
+import pickle
+import random
+import numpy as np
+import pytest
+from example_code import polynomial
+from example_code.polynomial import (Polynomial, ArrayPolynomial,
+                                     FrozenPolynomial)
+from example_code.sparse_polynomial import SparsePolynomial
+
+
+def test_add():
+    assert Polynomial((1, 2)) + Polynomial((0, 1, 3)) == Polynomial((1, 3, 3))
+    assert 1 + Polynomial((1, 2)) == Polynomial((2, 2))
+
+
+def test_mul_small():
+    assert Polynomial((1, 1)) * Polynomial((-1, 1)) == Polynomial((-1, 0, 1))
+    assert 2 * Polynomial((1, 2)) == Polynomial((2, 4))
+    assert Polynomial((1, 2)) * 2 == Polynomial((2, 4))
+
+
+@pytest.mark.parametrize("engine", (polynomial._mul_karatsuba,
+                                    polynomial._mul_kronecker))
+@pytest.mark.parametrize("na, nb", ((1, 1), (40, 40), (100, 37), (3, 200),
+                                    (129, 64), (300, 301)))
+def test_exact_engines(engine, na, nb):
+    rng = random.Random(na * nb)
+    a = [rng.randint(-10**6, 10**6) for _ in range(na)]
+    b = [rng.randint(-10**30, 10**30) for _ in range(nb)]
+    assert engine(a, b) == polynomial._mul_schoolbook(a, b)
+
+
+def test_mul_fraction():
+    a = Polynomial(tuple(Fraction(i, i + 1) for i in range(100)))
+    b = Polynomial(tuple(Fraction(1, i + 2) for i in range(90)))
+    expected = polynomial._mul_schoolbook(a.coefficients, b.coefficients)
+    assert (a * b).coefficients == tuple(expected)
+
+
+def test_mul_float():
+    rng = random.Random(0)
+    a = [rng.uniform(-1, 1) for _ in range(300)]
+    b = [rng.uniform(-1, 1) for _ in range(500)]
+    result = (Polynomial(tuple(a)) * Polynomial(tuple(b))).coefficients
+    expected = polynomial._mul_schoolbook(a, b)
+    assert len(result) == len(expected)
+    assert max(abs(x - y) for x, y in zip(result, expected)) < 1e-10
+
+
+def test_mul_int_fft():
+    rng = random.Random(1)
+    a = tuple(rng.randint(-1000, 1000) for _ in range(400))
+    b = tuple(rng.randint(-1000, 1000) for _ in range(300))
+    result = (Polynomial(a) * Polynomial(b)).coefficients
+    assert result == tuple(polynomial._mul_kronecker(a, b))
+    assert all(type(c) is int for c in result)
+
+
+def test_call_scalar():
+    p = Polynomial((1, 2, 3))
+    assert p(2) == 17
+    assert p(Fraction(1, 2)) == Fraction(11, 4)
+
+
+def test_call_array():
+    p = Polynomial((1, -2.5, 0, 3))
+    x = np.linspace(-2, 2, 12).reshape(3, 4)
+    assert np.allclose(p(x), 1 - 2.5 * x + 3 * x**3)
+
+
+def test_polyval_batch():
+    coefs = np.array([[1, 2, 3], [0, 0, 1], [4, 0, 0]])
+    x = np.arange(5.0)
+    values = polynomial.polyval(coefs, x)
+    assert values.shape == (3, 5)
+    for row, poly in zip(values, coefs):
+        assert np.allclose(row, Polynomial(tuple(poly))(x))
+
+
+def test_array_polynomial():
+    p = ArrayPolynomial((1, 2, 3))
+    assert p == Polynomial((1, 2, 3))
+    assert Polynomial((1, 2, 3)) == p
+    assert p != ArrayPolynomial((1, 2))
+    assert repr(p) == "ArrayPolynomial(array([1, 2, 3]))"
+    assert str(p) == "3x^2 + 2x + 1"
+    assert p + Polynomial((1, 1, 1, 1)) == Polynomial((2, 3, 4, 1))
+    assert Polynomial((1,)) + p == Polynomial((2, 2, 3))
+    assert 2 * p == Polynomial((2, 4, 6))
+    assert p * Polynomial((1, 1)) == Polynomial((1, 3, 5, 3))
+    assert p(2) == 17
+    assert not hasattr(p, "__dict__")
+
+
+def test_array_polynomial_slice():
+    p = ArrayPolynomial(np.arange(5.0))
+    q = p[1:3]
+    assert np.shares_memory(p.coefficients, q.coefficients)
+    assert q == Polynomial((1.0, 2.0))
+
+
+def test_array_polynomial_inplace():
+    coefs = np.zeros(4)
+    p = ArrayPolynomial(coefs)
+    p += Polynomial((1, 2))
+    p += 1
+    p *= 2
+    assert p.coefficients is coefs
+    assert p == Polynomial((4.0, 4.0, 0.0, 0.0))
+    p *= Polynomial((0, 1))
+    assert p == Polynomial((0.0, 4.0, 4.0, 0.0, 0.0))
+    q = ArrayPolynomial((1, 2))
+    q += 0.5
+    assert q == Polynomial((1.5, 2))
+
+
+def test_array_polynomial_inplace_read_only():
+    coefs = np.array([1.0, 2.0])
+    coefs.flags.writeable = False
+    p = ArrayPolynomial(coefs)
+    p += 1
+    p *= 2
+    assert p == Polynomial((4.0, 4.0))
+    assert list(coefs) == [1.0, 2.0]
+
+
+def test_array_polynomial_scalar_overflow():
+    p = ArrayPolynomial(np.array([1, 2], dtype=np.int8))
+    assert p + 1000 == Polynomial((1001, 2))
+    assert p * 1000 == Polynomial((1000, 2000))
+    q = ArrayPolynomial(np.array([1, 2], dtype=np.int8))
+    q += 1000
+    assert q == Polynomial((1001, 2))
+    q = ArrayPolynomial(np.array([1, 2], dtype=np.int8))
+    q *= 1000
+    assert q == Polynomial((1000, 2000))
+
+
+@pytest.mark.parametrize("na, nb", ((5, 2), (2, 5), (7, 1), (300, 70)))
+def test_divmod(na, nb):
+    rng = random.Random(na + nb)
+    a = Polynomial(tuple(rng.randint(-9, 9) for _ in range(na)))
+    b = Polynomial(tuple(rng.randint(-9, 9) for _ in range(nb - 1)) + (1,))
+    q, r = divmod(a, b)
+    assert r.degree() < b.degree() or r == Polynomial((0,))
+    assert SparsePolynomial.from_dense(q * b + r) == \
+        SparsePolynomial.from_dense(a)
+    assert a // b == q and a % b == r
+
+
+def test_divmod_newton_matches_long():
+    rng = random.Random(5)
+    a = [Fraction(rng.randint(-9, 9)) for _ in range(200)]
+    b = [Fraction(rng.randint(-9, 9)) for _ in range(79)] + [Fraction(2)]
+    assert polynomial._divmod_newton(a, b) == polynomial._divmod_long(a, b)
+
+
+def test_divmod_by_zero():
+    with pytest.raises(ZeroDivisionError):
+        divmod(Polynomial((1, 2)), Polynomial((0, 0)))
+
+
+@pytest.mark.parametrize("op", [operator.floordiv, operator.mod])
+def test_division_unsupported_type(op):
+    with pytest.raises(TypeError, match="unsupported operand"):
+        op(Polynomial((1, 2)), "a")
+
+
+def test_gcd():
+    common = Polynomial((-2, 1)) * Polynomial((3, 1))
+    a = common * Polynomial((1, 0, 1))
+    b = common * Polynomial((5, 7))
+    assert a.gcd(b) == Polynomial((-6, 1, 1))
+    assert Polynomial((1, 1)).gcd(Polynomial((2,))) == Polynomial((1,))
+
+
+def test_gcd_float():
+    a = Polynomial((-1.0, 0.0, 1.0))
+    b = Polynomial((1.0, 1.0)) * Polynomial((0.5, 1.5))
+    g = a.gcd(b, tol=1e-12)
+    assert np.allclose(g.coefficients, (1.0, 1.0))
+
+
+def test_divmod_newton_float():
+    rng = random.Random(6)
+    b = [rng.uniform(-1, 1) / 300 for _ in range(99)] + [1.0]
+    q = [rng.uniform(-1, 1) for _ in range(200)]
+    r = [rng.uniform(-1, 1) for _ in range(99)]
+    a = Polynomial(tuple(q)) * Polynomial(tuple(b)) + Polynomial(tuple(r))
+    quotient, remainder = divmod(a, Polynomial(tuple(b)))
+    assert np.allclose(quotient.coefficients, q)
+    assert np.allclose(remainder.coefficients, r)
+
+
+def test_multipoint_evaluate():
+    rng = random.Random(2)
+    p = Polynomial(tuple(rng.randint(-99, 99) for _ in range(150)))
+    points = list(range(-70, 80))
+    assert p.multipoint_evaluate(points) == \
+        [p(x) for x in points]
+
+
+def test_multipoint_evaluate_float():
+    p = Polynomial((1.0, -2.0, 0.5))
+    assert np.allclose(p.multipoint_evaluate([0.0, 1.0, 2.0]),
+                       [1.0, -0.5, -1.0])
+
+
+def test_interpolate():
+    rng = random.Random(3)
+    p = Polynomial(tuple(rng.randint(-99, 99) for _ in range(40)))
+    points = rng.sample(range(-1000, 1000), 40)
+    q = Polynomial.interpolate(points, [p(x) for x in points])
+    assert q == p
+
+
+def test_interpolate_float():
+    points = np.linspace(-1, 1, 32)
+    values = np.cos(3 * points)
+    q = Polynomial.interpolate(points, values)
+    assert np.allclose(q.multipoint_evaluate(points), values)
+
+
+def test_interpolate_repeated_point():
+    with pytest.raises(ValueError):
+        Polynomial.interpolate([1, 2, 1], [0, 1, 2])
+
+
+def test_frozen_polynomial():
+    p = FrozenPolynomial((1, 2, 3))
+    q = FrozenPolynomial([1, 2, 3])
+    assert p == q and hash(p) == hash(q)
+    assert p == Polynomial((1, 2, 3)) and Polynomial((1, 2, 3)) == p
+    assert p != FrozenPolynomial((1, 2))
+    assert len({p, q, FrozenPolynomial((3,))}) == 2
+    assert {p: "a"}[q] == "a"
+    assert p + q == Polynomial((2, 4, 6))
+    with pytest.raises(AttributeError):
+        p.coefficients = (0,)
+    assert pickle.loads(pickle.dumps(p)) == p
+
+
+def test_frozen_polynomial_arithmetic():
+    p = FrozenPolynomial((1, 2))
+    for result in (p + p, p + 1, 1 + p, p * p, p * 2, 2 * p,
+                   p // p, p % p, p.derivative()):
+        assert type(result) is FrozenPolynomial
+        hash(result)
+    assert {p * p: "square"}[FrozenPolynomial((1, 4, 4))] == "square"
+
+
+def test_polynomial_unhashable():
+    with pytest.raises(TypeError):
+        hash(Polynomial((1,)))
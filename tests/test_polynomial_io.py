@@ -0,0 +1,68 @@
+from fractions import Fraction
+import io
+import numpy as np
+import pytest
+from example_code.polynomial import Polynomial
+from example_code.polynomial_io import (write_polynomials, read_polynomials,
+                                        save_polynomials, load_polynomials)
+
+
+@pytest.mark.parametrize("coefs", ((1, 2, 3), (0,), (0, 1), (1, 1, 1),
+                                   (-1, 0, -2.5), (Fraction(1, 2), 0, 1),
+                                   (0, 0, 0, 1), (1j, 2 + 3j), (1e-20, 4)))
+def test_from_string_round_trip(coefs):
+    p = Polynomial(coefs)
+    assert Polynomial.from_string(str(p)) == p
+
+
+def test_from_string_invalid():
+    with pytest.raises(ValueError):
+        Polynomial.from_string("3y + 1")
+
+
+def test_text_round_trip():
+    polys = [Polynomial((1, 2)), Polynomial((0,)), Polynomial((3, 0, 1))]
+    file = io.StringIO()
+    write_polynomials(file, iter(polys))
+    file.seek(0)
+    assert list(read_polynomials(file)) == polys
+
+
+def test_binary_round_trip(tmp_path):
+    polys = [Polynomial((1.5, 2)), Polynomial((0,)), Polynomial((3, 0, 1))]
+    path = str(tmp_path / "polys.bin")
+    save_polynomials(path, polys)
+    archive = load_polynomials(path)
+    assert len(archive) == 3
+    assert list(archive) == polys
+    assert archive[-1] == polys[-1]
+    assert archive.data.dtype == np.float64
+    assert list(archive.lengths) == [2, 1, 3]
+    with pytest.raises(IndexError):
+        archive[3]
+
+
+def test_binary_int(tmp_path):
+    path = str(tmp_path / "polys.bin")
+    with open(path, "wb") as f:
+        save_polynomials(f, [Polynomial((1, 2)), Polynomial((5,))])
+    archive = load_polynomials(path)
+    assert archive.data.dtype == np.int64
+    assert archive[0:2] == [Polynomial((1, 2)), Polynomial((5,))]
+
+
+def test_binary_item_inplace(tmp_path):
+    path = str(tmp_path / "polys.bin")
+    save_polynomials(path, [Polynomial((1, 2)), Polynomial((5,))])
+    archive = load_polynomials(path)
+    p = archive[0]
+    p += 1
+    p *= 2
+    assert p == Polynomial((4, 4))
+    assert archive[0] == Polynomial((1, 2))
+
+
+def test_binary_object(tmp_path):
+    with pytest.raises(TypeError):
+        save_polynomials(str(tmp_path / "polys.bin"),
+                         [Polynomial((2**100,))])
@@ -0,0 +1,69 @@
+import random
+import pytest
+from example_code.polynomial import (Polynomial, ArrayPolynomial,
+                                     FrozenPolynomial)
+from example_code.sparse_polynomial import SparsePolynomial
+
+
+def random_sparse(rng, n, degree):
+    return SparsePolynomial(
+        {rng.randrange(degree): rng.randint(-5, 5) for _ in range(n)}
+    )
+
+
+def test_construction():
+    p = SparsePolynomial([(3, 1), (0, 2), (3, 1), (1, 0)])
+    assert p.terms == ((0, 2), (3, 2))
+    assert p.degree() == 3
+    assert repr(p) == "SparsePolynomial({0: 2, 3: 2})"
+
+
+def test_str_matches_dense():
+    dense = Polynomial((1, 1, 0, 2, 1))
+    assert str(SparsePolynomial.from_dense(dense)) == str(dense)
+    assert str(SparsePolynomial({})) == "0"
+    assert str(SparsePolynomial({10**6: 1, 0: 1})) == "x^1000000 + 1"
+
+
+def test_add_and_mul():
+    rng = random.Random(0)
+    for _ in range(20):
+        p = random_sparse(rng, 8, 40)
+        q = random_sparse(rng, 8, 40)
+        assert p + q == p.to_dense() + q.to_dense()
+        assert (p * q) == p.to_dense() * q.to_dense()
+
+
+def test_cancellation():
+    p = SparsePolynomial({5: 1, 0: 1})
+    assert (p + SparsePolynomial({5: -1})).terms == ((0, 1),)
+    assert p + -1 == SparsePolynomial({5: 1})
+
+
+def test_mixed_arithmetic():
+    sparse = SparsePolynomial({1000: 1})
+    dense = Polynomial((1, 2))
+    assert isinstance(sparse + dense, SparsePolynomial)
+    assert isinstance(dense + sparse, SparsePolynomial)
+    assert (dense + sparse).terms == ((0, 1), (1, 2), (1000, 1))
+    assert isinstance(dense * sparse, SparsePolynomial)
+    full = SparsePolynomial({0: 1, 2: 1})
+    assert isinstance(full + dense, Polynomial)
+    assert full + dense == Polynomial((2, 2, 1))
+    assert Polynomial((2, 2, 1)) == full + dense
+
+
+@pytest.mark.parametrize("dense", [Polynomial((1, 0, 1)),
+                                   ArrayPolynomial((1, 0, 1)),
+                                   FrozenPolynomial((1, 0, 1))])
+def test_mixed_equality(dense):
+    sparse = SparsePolynomial({0: 1, 2: 1})
+    assert sparse == dense
+    assert dense == sparse
+    assert not dense != sparse
+    assert dense != SparsePolynomial({0: 1})
+    assert SparsePolynomial({0: 1}) != dense
+
+
+def test_call():
+    assert SparsePolynomial({100: 1, 0: 1})(2) == 2**100 + 1
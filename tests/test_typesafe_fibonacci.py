@@ -0,0 +1,16 @@
+from fractions import Fraction
+import numpy as np
+import pytest
+from fibonacci import fib
+from fibonacci.typesafe_fibonacci import typesafe_fib
+
+
+@pytest.mark.parametrize("n", (0, 1, 10, np.int64(10), np.uint8(90), True))
+def test_typesafe_fib_integers(n):
+    assert typesafe_fib(n) == fib(int(n))
+
+
+@pytest.mark.parametrize("n", (1.5, Fraction(3), "3", np.float64(3)))
+def test_typesafe_fib_rejects(n):
+    with pytest.raises(TypeError):
+        typesafe_fib(n)